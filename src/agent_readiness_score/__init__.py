@@ -2,22 +2,57 @@
 
 __version__ = "0.1.0"
 
-# Re-export main components for convenience
-from agent_readiness_score.core import (
-    Category,
-    CategoryScore,
-    Finding,
-    ScanReport,
-    CATEGORY_WEIGHTS,
-    calculate_grade,
-    BaseScanner,
-    ScannerRegistry,
-    ScanEngine,
-    Language,
-    LanguageStats,
-    detect_languages,
-)
-from agent_readiness_score.output import ConsoleFormatter, JSONFormatter
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agent_readiness_score.core import (
+        Category,
+        CategoryScore,
+        Finding,
+        ScanReport,
+        CATEGORY_WEIGHTS,
+        calculate_grade,
+        BaseScanner,
+        ScannerRegistry,
+        ScanEngine,
+        Language,
+        LanguageStats,
+        detect_languages,
+    )
+    from agent_readiness_score.output import ConsoleFormatter, JSONFormatter
+
+# Main components are re-exported for convenience, but imported on first
+# access so that importing the package (e.g. for the CLI) stays cheap
+_LAZY_EXPORTS = {
+    "Category": "agent_readiness_score.core",
+    "CategoryScore": "agent_readiness_score.core",
+    "Finding": "agent_readiness_score.core",
+    "ScanReport": "agent_readiness_score.core",
+    "CATEGORY_WEIGHTS": "agent_readiness_score.core",
+    "calculate_grade": "agent_readiness_score.core",
+    "BaseScanner": "agent_readiness_score.core",
+    "ScannerRegistry": "agent_readiness_score.core",
+    "ScanEngine": "agent_readiness_score.core",
+    "Language": "agent_readiness_score.core",
+    "LanguageStats": "agent_readiness_score.core",
+    "detect_languages": "agent_readiness_score.core",
+    "ConsoleFormatter": "agent_readiness_score.output",
+    "JSONFormatter": "agent_readiness_score.output",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS})
 
 __all__ = [
     "__version__",
@@ -4,16 +4,9 @@ from enum import Enum
 from pathlib import Path
 
 import typer
-from rich.console import Console
 
-# Import scanners to trigger auto-registration
-from agent_readiness_score import scanners  # noqa: F401
-
-from agent_readiness_score.core.engine import ScanEngine
-from agent_readiness_score.core.models import Category, CATEGORY_WEIGHTS
-from agent_readiness_score.core.registry import ScannerRegistry
-from agent_readiness_score.output.console import ConsoleFormatter
-from agent_readiness_score.output.json_output import JSONFormatter
+# Rich, the scanners and the output formatters are imported inside the
+# commands that use them, so --version and --help start quickly
 
 
 class OutputFormat(str, Enum):
@@ -30,15 +23,12 @@ app = typer.Typer(
     add_completion=True,
 )
 
-console = Console()
-
-
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
         from agent_readiness_score import __version__
 
-        console.print(f"agent-ready version {__version__}")
+        print(f"agent-ready version {__version__}")
         raise typer.Exit()
 
 
@@ -77,6 +67,11 @@ def scan(
         min=0,
         max=100,
     ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Reuse the detected repository structure from earlier scans.",
+    ),
 ) -> None:
     """Scan a repository and calculate its Agent Readiness Score.
 
@@ -92,7 +87,15 @@ def scan(
     - Documentation (10%): README, docs, and API specs
     - Static Typing (10%): Type definitions and checkers
     """
-    engine = ScanEngine()
+    from rich.console import Console
+
+    # Import scanners to trigger auto-registration
+    from agent_readiness_score import scanners  # noqa: F401
+    from agent_readiness_score.core.engine import ScanEngine
+    from agent_readiness_score.output.json_output import JSONFormatter
+
+    console = Console()
+    engine = ScanEngine(use_cache=cache)
 
     try:
         with console.status("[bold blue]Scanning repository..."):
@@ -102,11 +105,13 @@ def scan(
         raise typer.Exit(code=1)
 
     # Output results
-    console_formatter = ConsoleFormatter(console, verbose=verbose)
     json_formatter = JSONFormatter()
 
     if output in (OutputFormat.TABLE, OutputFormat.BOTH):
-        console_formatter.format(report)
+        # Tables and panels are only needed (and imported) for console output
+        from agent_readiness_score.output.console import ConsoleFormatter
+
+        ConsoleFormatter(console, verbose=verbose).format(report)
 
     if output in (OutputFormat.JSON, OutputFormat.BOTH):
         json_output = json_formatter.format(report)
@@ -128,8 +133,16 @@ def scan(
 @app.command()
 def categories() -> None:
     """List all scoring categories and their weights."""
+    from rich.console import Console
     from rich.table import Table
 
+    # Import scanners to trigger auto-registration
+    from agent_readiness_score import scanners  # noqa: F401
+    from agent_readiness_score.core.models import Category, CATEGORY_WEIGHTS
+    from agent_readiness_score.core.registry import ScannerRegistry
+
+    console = Console()
+
     table = Table(title="Agent Readiness Scoring Categories")
     table.add_column("Category", style="cyan")
     table.add_column("Weight", justify="right", style="green")
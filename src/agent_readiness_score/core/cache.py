@@ -0,0 +1,81 @@
+"""On-disk cache of detected repository structures.
+
+A cached structure records every path detection looked at (directories
+listed, files read, paths probed) with its mtime. The entry is reused only
+while all of those paths are unchanged, so adding a package, a test
+directory or editing a workspace config invalidates it.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from agent_readiness_score.core.models import RepoStructure
+
+# Bump when the entry layout or detection logic changes
+CACHE_FORMAT = 1
+
+# Paths modified this close to (or after) detection started may have changed
+# within the same mtime tick; entries depending on them are never trusted.
+# Generous enough for filesystems with 1s timestamp resolution.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def cache_dir() -> Path:
+    """Directory holding cached structures (XDG cache dir aware)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "agent-readiness-score"
+
+
+def _cache_file(repo_path: Path) -> Path:
+    key = hashlib.blake2b(os.fsencode(repo_path.resolve()), digest_size=16).hexdigest()
+    return cache_dir() / f"structure-{key}.json"
+
+
+def _mtime_ns(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def load_structure(repo_path: Path) -> RepoStructure | None:
+    """Return the cached structure for repo_path, or None if missing or stale."""
+    try:
+        with open(_cache_file(repo_path), "rb") as f:
+            entry: dict[str, Any] = json.load(f)
+        if entry.get("format") != CACHE_FORMAT:
+            return None
+        fresh_after = entry["started_ns"] - RACY_WINDOW_NS
+        for path, mtime in entry["deps"].items():
+            current = _mtime_ns(path)
+            if current != mtime or (current is not None and current >= fresh_after):
+                return None
+        return RepoStructure.from_dict(entry["structure"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_structure(
+    repo_path: Path, structure: RepoStructure, watched: set[str], started_ns: int
+) -> None:
+    """Cache structure along with the mtimes of the paths it was derived from.
+
+    Failing to write the cache (read-only home, full disk) is not an error.
+    """
+    entry = {
+        "format": CACHE_FORMAT,
+        "started_ns": started_ns,
+        "deps": {path: _mtime_ns(path) for path in sorted(watched)},
+        "structure": structure.to_dict(),
+    }
+    cache_file = _cache_file(repo_path)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(json.dumps(entry))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
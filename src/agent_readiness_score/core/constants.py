@@ -0,0 +1,13 @@
+"""Constants shared across detection and scanning."""
+
+# Directories never searched during package detection, package scanning or
+# language detection (dependencies, build output, caches and editor state).
+# Language detection skips a few more, see language.SKIP_DIRS
+EXCLUDED_DIRS: frozenset[str] = frozenset({
+    "node_modules", ".git", "__pycache__", ".venv", "venv", "env",
+    "dist", "build", "target", ".next", ".nuxt", "coverage",
+    ".pytest_cache", ".mypy_cache", ".ruff_cache", "vendor",
+    ".cargo", ".rustup", "Pods", ".gradle", ".idea", ".vscode",
+    ".turbo", ".vercel", ".netlify", "out", ".output",
+    ".tox", ".nox", ".terraform",
+})
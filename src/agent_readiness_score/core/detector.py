@@ -1,39 +1,113 @@
 """Package and repository structure detection - optimized for large repos."""
 
+import contextvars
+import functools
 import json
+import mmap
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, NamedTuple
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib  # type: ignore[import-not-found]
+
+from agent_readiness_score.core.cache import load_structure, save_structure
+from agent_readiness_score.core.constants import EXCLUDED_DIRS
 from agent_readiness_score.core.language import Language
 from agent_readiness_score.core.models import Package, RepoStructure, RepoType
 
 
 # Package manifest files that indicate a package root
-PACKAGE_MANIFESTS = {
-    "package.json": ("npm", {Language.JAVASCRIPT, Language.TYPESCRIPT}),
-    "pyproject.toml": ("python", {Language.PYTHON}),
-    "setup.py": ("python", {Language.PYTHON}),
-    "Cargo.toml": ("cargo", {Language.RUST}),
-    "go.mod": ("go", {Language.GO}),
-    "Gemfile": ("bundler", {Language.RUBY}),
-    "pom.xml": ("maven", {Language.JAVA}),
-    "build.gradle": ("gradle", {Language.JAVA, Language.KOTLIN}),
-    "build.gradle.kts": ("gradle", {Language.KOTLIN}),
-    "Package.swift": ("spm", {Language.SWIFT}),
-    "composer.json": ("composer", {Language.PHP}),
-    "mix.exs": ("mix", {Language.ELIXIR}),
-    "pubspec.yaml": ("pub", {Language.DART}),
+PACKAGE_MANIFESTS: dict[str, tuple[str, frozenset[Language]]] = {
+    "package.json": ("npm", frozenset({Language.JAVASCRIPT, Language.TYPESCRIPT})),
+    "pyproject.toml": ("python", frozenset({Language.PYTHON})),
+    "setup.py": ("python", frozenset({Language.PYTHON})),
+    "Cargo.toml": ("cargo", frozenset({Language.RUST})),
+    "go.mod": ("go", frozenset({Language.GO})),
+    "Gemfile": ("bundler", frozenset({Language.RUBY})),
+    "pom.xml": ("maven", frozenset({Language.JAVA})),
+    "build.gradle": ("gradle", frozenset({Language.JAVA, Language.KOTLIN})),
+    "build.gradle.kts": ("gradle", frozenset({Language.KOTLIN})),
+    "Package.swift": ("spm", frozenset({Language.SWIFT})),
+    "composer.json": ("composer", frozenset({Language.PHP})),
+    "mix.exs": ("mix", frozenset({Language.ELIXIR})),
+    "pubspec.yaml": ("pub", frozenset({Language.DART})),
+}
+
+# Manifest names as a set, so directory listings can be intersected with it
+_MANIFEST_NAMES: frozenset[str] = frozenset(PACKAGE_MANIFESTS)
+
+# Position of each manifest in PACKAGE_MANIFESTS (lower wins)
+_MANIFEST_RANK: dict[str, int] = {manifest: i for i, manifest in enumerate(PACKAGE_MANIFESTS)}
+
+# Languages implied by a manifest's presence (tsconfig.json is handled
+# separately since it only counts next to a package.json)
+_MANIFEST_TO_LANGS: dict[str, frozenset[Language]] = {
+    "package.json": frozenset({Language.JAVASCRIPT}),
+    "pyproject.toml": frozenset({Language.PYTHON}),
+    "setup.py": frozenset({Language.PYTHON}),
+    "go.mod": frozenset({Language.GO}),
+    "Cargo.toml": frozenset({Language.RUST}),
+    "Gemfile": frozenset({Language.RUBY}),
+    "pom.xml": frozenset({Language.JAVA}),
+    "build.gradle": frozenset({Language.JAVA}),
+    "Package.swift": frozenset({Language.SWIFT}),
+    "composer.json": frozenset({Language.PHP}),
+    "mix.exs": frozenset({Language.ELIXIR}),
+    "pubspec.yaml": frozenset({Language.DART}),
 }
 
+# Source extensions checked by the quick language scan
+_EXTENSION_LANGS: dict[str, Language] = {
+    ".py": Language.PYTHON,
+    ".js": Language.JAVASCRIPT,
+    ".jsx": Language.JAVASCRIPT,
+    ".ts": Language.TYPESCRIPT,
+    ".tsx": Language.TYPESCRIPT,
+    ".go": Language.GO,
+    ".rs": Language.RUST,
+    ".rb": Language.RUBY,
+    ".java": Language.JAVA,
+    ".kt": Language.KOTLIN,
+    ".swift": Language.SWIFT,
+    ".cs": Language.CSHARP,
+    ".php": Language.PHP,
+    ".ex": Language.ELIXIR,
+    ".exs": Language.ELIXIR,
+    ".dart": Language.DART,
+    ".sol": Language.JAVASCRIPT,  # Solidity often paired with JS tooling
+}
+_ALL_EXTENSION_LANGS = frozenset(_EXTENSION_LANGS.values())
+
 # Lockfiles that indicate dependency management
-LOCKFILES = {
+LOCKFILES: frozenset[str] = frozenset({
     "package-lock.json", "yarn.lock", "pnpm-lock.yaml", "bun.lockb",
     "Cargo.lock", "go.sum", "Gemfile.lock", "poetry.lock", "uv.lock",
     "composer.lock", "mix.lock", "pubspec.lock", "Package.resolved",
     "packages.lock.json",
-}
+})
 
 # Test directory patterns
-TEST_DIRS = {"tests", "test", "__tests__", "spec", "specs", "_tests", "e2e"}
+TEST_DIRS: frozenset[str] = frozenset({
+    "tests", "test", "__tests__", "spec", "specs", "_tests", "e2e",
+})
+
+# Test file names: test_foo.py, foo_test.go, foo.test.ts, foo.spec.js, conftest.py, ...
+_TEST_FILE_RE = re.compile(
+    r"^test_.*\.(?:py|js|ts|go|rs)$"
+    r"|_test\.(?:py|go|rs)$"
+    r"|\.(?:test|spec)\.[cm]?[jt]sx?$"
+    r"|^(?:tests?|conftest)\.py$",
+    re.IGNORECASE,
+)
 
 # Type config patterns per language
 TYPE_CONFIGS = {
@@ -43,14 +117,21 @@ TYPE_CONFIGS = {
     Language.RUST: [],  # Rust has built-in types
 }
 
-# Directories to skip
-SKIP_DIRS = {
-    "node_modules", ".git", "__pycache__", ".venv", "venv", "env",
-    "dist", "build", "target", ".next", ".nuxt", "coverage",
-    ".pytest_cache", ".mypy_cache", ".ruff_cache", "vendor",
-    ".cargo", ".rustup", "Pods", ".gradle", ".idea", ".vscode",
-    ".turbo", ".vercel", ".netlify", "out", ".output",
-}
+# Files smaller than this are read outright rather than mmapped when
+# searching them for a needle before parsing
+MMAP_MIN_SIZE = 4096
+
+# Package creation is I/O bound (scandir/stat release the GIL), so larger
+# repos create packages on a thread pool. Below the threshold, thread
+# start-up costs more than it saves.
+PARALLEL_MIN_PACKAGES = 4
+MAX_DETECTION_WORKERS = 32
+
+# Paths the running detection has looked at, collected only while detecting
+# with the structure cache enabled (see _watch)
+_watched: contextvars.ContextVar[set[str] | None] = contextvars.ContextVar(
+    "_watched", default=None
+)
 
 # Shared config files at root
 SHARED_CONFIGS = [
@@ -75,18 +156,147 @@ SHARED_CONFIGS = [
 ]
 
 
-def detect_repo_structure(repo_path: Path) -> RepoStructure:
-    """Detect the repository structure (single, monorepo, or polyrepo)."""
+class _Listing(NamedTuple):
+    """One directory's entries, gathered by a single scandir."""
+    names: frozenset[str]
+    dir_names: frozenset[str]
+    file_names: tuple[str, ...]
+    # Paths of subdirectories worth walking (not in EXCLUDED_DIRS, not symlinks)
+    subdirs: tuple[str, ...]
+    # Paths of subdirectories not in EXCLUDED_DIRS, symlinks included
+    # (workspace members may be linked in)
+    linked_subdirs: tuple[str, ...]
+    # Languages of the files' extensions (per _EXTENSION_LANGS)
+    langs: frozenset[Language]
+
+
+_EMPTY_LISTING = _Listing(frozenset(), frozenset(), (), (), (), frozenset())
+
+
+def _list_dir(path: str) -> _Listing:
+    """List a directory, collecting everything detection needs from it in one pass."""
+    _watch(path)
+    names: list[str] = []
+    dir_names: list[str] = []
+    file_names: list[str] = []
+    subdirs: list[str] = []
+    linked_subdirs: list[str] = []
+    langs: set[Language] = set()
+    skip_dirs = EXCLUDED_DIRS
+    lang_extensions = _EXTENSION_LANGS
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                name = entry.name
+                names.append(name)
+                if entry.is_dir():
+                    dir_names.append(name)
+                    if name not in skip_dirs:
+                        linked_subdirs.append(entry.path)
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                else:
+                    file_names.append(name)
+                    dot = name.rfind(".")
+                    if dot > 0:
+                        lang = lang_extensions.get(name[dot:].lower())
+                        if lang is not None:
+                            langs.add(lang)
+    except OSError:
+        return _EMPTY_LISTING
+    return _Listing(
+        frozenset(names),
+        frozenset(dir_names),
+        tuple(file_names),
+        tuple(subdirs),
+        tuple(linked_subdirs),
+        frozenset(langs),
+    )
+
+
+class _DirListings:
+    """Directory listings memoized for one detection run.
+
+    Package discovery, language scans, test checks and root config checks
+    all read directories through this, so each directory is listed at most
+    once no matter how many of them look at it.
+    """
+
+    def __init__(self) -> None:
+        self._listings: dict[str, _Listing] = {}
+
+    def get(self, path: str | Path) -> _Listing:
+        key = os.fspath(path)
+        listing = self._listings.get(key)
+        if listing is None:
+            listing = self._listings[key] = _list_dir(key)
+        return listing
+
+
+@dataclass(frozen=True)
+class _DetectionContext:
+    """State shared by every step of one detection run.
+
+    Besides the directory listings, holds repository-root lookups that each
+    package would otherwise repeat (shared lockfiles, tsconfig, Python type
+    configs).
+    """
+    dirs: _DirListings
+    root_names: frozenset[str]
+    has_any_lockfile: bool
+    root_tsconfig: bool
+    root_python_type_configs: frozenset[str]
+
+    @classmethod
+    def build(cls, repo_path: Path) -> "_DetectionContext":
+        dirs = _DirListings()
+        names = dirs.get(repo_path).names
+        return cls(
+            dirs=dirs,
+            root_names=names,
+            has_any_lockfile=not LOCKFILES.isdisjoint(names),
+            root_tsconfig="tsconfig.json" in names,
+            root_python_type_configs=names.intersection(TYPE_CONFIGS[Language.PYTHON]),
+        )
+
+
+def detect_repo_structure(repo_path: Path, use_cache: bool = False) -> RepoStructure:
+    """Detect the repository structure (single, monorepo, or polyrepo).
+
+    With use_cache, a structure cached by a previous run is returned if none
+    of the paths it was derived from changed; otherwise the result is cached.
+    """
+    if not use_cache:
+        return _detect_repo_structure(repo_path)
+
+    cached = load_structure(repo_path)
+    if cached is not None:
+        return cached
+
+    started_ns = time.time_ns()
+    watched: set[str] = set()
+    token = _watched.set(watched)
+    try:
+        structure = _detect_repo_structure(repo_path)
+    finally:
+        _watched.reset(token)
+    save_structure(repo_path, structure, watched, started_ns)
+    return structure
+
+
+def _detect_repo_structure(repo_path: Path) -> RepoStructure:
+    ctx = _DetectionContext.build(repo_path)
+
     # First check for workspace/monorepo config
-    workspace_dirs = _get_workspace_directories(repo_path)
+    workspace_dirs = _get_workspace_directories(repo_path, ctx)
 
     if workspace_dirs:
         # It's a monorepo - scan workspace directories
-        packages = _scan_workspace_packages(repo_path, workspace_dirs)
+        packages = _scan_workspace_packages(repo_path, workspace_dirs, ctx)
         repo_type = RepoType.MONOREPO
     else:
         # Scan for packages normally
-        packages = _detect_packages(repo_path)
+        packages = _detect_packages(repo_path, ctx)
         if len(packages) > 1:
             repo_type = RepoType.POLYREPO
         elif len(packages) == 1 and packages[0].path != Path("."):
@@ -94,8 +304,8 @@ def detect_repo_structure(repo_path: Path) -> RepoStructure:
         else:
             repo_type = RepoType.SINGLE
 
-    root_configs = _detect_root_configs(repo_path)
-    root_languages = _detect_languages_fast(repo_path, max_depth=1)
+    root_configs = _detect_root_configs(repo_path, ctx)
+    root_languages = _detect_languages_fast(repo_path, ctx, max_depth=1)
 
     return RepoStructure(
         type=repo_type,
@@ -105,16 +315,19 @@ def detect_repo_structure(repo_path: Path) -> RepoStructure:
     )
 
 
-def _get_workspace_directories(repo_path: Path) -> list[Path]:
+def _get_workspace_directories(repo_path: Path, ctx: _DetectionContext) -> list[Path]:
     """Get workspace directories from monorepo config."""
     workspaces: list[Path] = []
 
+    def list_subdirs(base_path: Path) -> list[Path]:
+        return [Path(subdir) for subdir in ctx.dirs.get(base_path).linked_subdirs]
+
     # Check package.json workspaces
     pkg_json = repo_path / "package.json"
-    if pkg_json.exists():
+    if "package.json" in ctx.root_names:
+        data = _read_json_if_contains(pkg_json, b'"workspaces"')
         try:
-            with open(pkg_json) as f:
-                data = json.load(f)
+            if isinstance(data, dict):
                 ws = data.get("workspaces", [])
                 # Handle both array and object formats
                 if isinstance(ws, dict):
@@ -124,20 +337,20 @@ def _get_workspace_directories(repo_path: Path) -> list[Path]:
                     if "*" in pattern:
                         base = pattern.replace("/*", "").replace("/**", "")
                         base_path = repo_path / base
-                        if base_path.is_dir():
-                            for subdir in base_path.iterdir():
-                                if subdir.is_dir() and subdir.name not in SKIP_DIRS:
-                                    workspaces.append(subdir)
+                        if _probe_dir(base_path):
+                            workspaces.extend(list_subdirs(base_path))
                     else:
                         ws_path = repo_path / pattern
-                        if ws_path.is_dir():
+                        if _probe_dir(ws_path):
                             workspaces.append(ws_path)
-        except (json.JSONDecodeError, IOError, KeyError):
+        except (IOError, KeyError, TypeError):
+            # TypeError: non-string workspace entries
             pass
 
     # Check pnpm-workspace.yaml
     pnpm_ws = repo_path / "pnpm-workspace.yaml"
-    if pnpm_ws.exists() and not workspaces:
+    if "pnpm-workspace.yaml" in ctx.root_names and not workspaces:
+        _watch(pnpm_ws)
         try:
             content = pnpm_ws.read_text()
             # Simple YAML parsing for packages list
@@ -148,140 +361,234 @@ def _get_workspace_directories(repo_path: Path) -> list[Path]:
                     if "*" in pattern:
                         base = pattern.replace("/*", "").replace("/**", "")
                         base_path = repo_path / base
-                        if base_path.is_dir():
-                            for subdir in base_path.iterdir():
-                                if subdir.is_dir() and subdir.name not in SKIP_DIRS:
-                                    workspaces.append(subdir)
+                        if _probe_dir(base_path):
+                            workspaces.extend(list_subdirs(base_path))
                     else:
                         ws_path = repo_path / pattern
-                        if ws_path.is_dir():
+                        if _probe_dir(ws_path):
                             workspaces.append(ws_path)
         except IOError:
             pass
 
     # Check for Cargo workspace
     cargo_toml = repo_path / "Cargo.toml"
-    if cargo_toml.exists() and not workspaces:
+    if "Cargo.toml" in ctx.root_names and not workspaces:
+        data = _read_toml_if_contains(cargo_toml, b"[workspace]") or {}
+        workspace = data.get("workspace")
+        members = workspace.get("members", []) if isinstance(workspace, dict) else []
         try:
-            content = cargo_toml.read_text()
-            if "[workspace]" in content:
-                # Parse members from Cargo.toml
-                in_members = False
-                for line in content.splitlines():
-                    if "members" in line and "=" in line:
-                        in_members = True
-                    elif in_members:
-                        if "]" in line:
-                            break
-                        member = line.strip().strip('",[]')
-                        if member and not member.startswith("#"):
-                            if "*" in member:
-                                base = member.replace("/*", "")
-                                base_path = repo_path / base
-                                if base_path.is_dir():
-                                    for subdir in base_path.iterdir():
-                                        if subdir.is_dir() and subdir.name not in SKIP_DIRS:
-                                            workspaces.append(subdir)
-                            else:
-                                ws_path = repo_path / member
-                                if ws_path.is_dir():
-                                    workspaces.append(ws_path)
+            for member in members:
+                if not isinstance(member, str):
+                    continue
+                if "*" in member:
+                    base = member.replace("/*", "")
+                    base_path = repo_path / base
+                    if _probe_dir(base_path):
+                        workspaces.extend(list_subdirs(base_path))
+                else:
+                    ws_path = repo_path / member
+                    if _probe_dir(ws_path):
+                        workspaces.append(ws_path)
         except IOError:
             pass
 
-    return workspaces
+    # Overlapping patterns (e.g. "packages/*" and "packages/core") can list
+    # a directory twice; dedupe on the path string, which hashes cheaper
+    # than a Path
+    seen_paths: set[str] = set()
+    unique: list[Path] = []
+    for ws_path in workspaces:
+        key = os.fspath(ws_path)
+        if key not in seen_paths:
+            seen_paths.add(key)
+            unique.append(ws_path)
+    return unique
 
 
-def _scan_workspace_packages(repo_path: Path, workspace_dirs: list[Path]) -> list[Package]:
-    """Scan known workspace directories for packages."""
-    packages: list[Package] = []
+def _watch(path: Path | str) -> None:
+    """Record that detection depends on path (no-op unless caching)."""
+    watched = _watched.get()
+    if watched is not None:
+        watched.add(os.fspath(path))
 
-    for ws_dir in workspace_dirs:
-        pkg = _create_package_fast(repo_path, ws_dir)
-        if pkg:
-            packages.append(pkg)
 
-    return packages
+def _probe_dir(path: Path) -> bool:
+    """is_dir() that is recorded as a dependency for the structure cache."""
+    _watch(path)
+    return path.is_dir()
+
+
+def _file_key(path: Path) -> tuple[str, int, int] | None:
+    """(path, mtime_ns, size) identifying a file's current contents, or None if unreadable."""
+    _watch(path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return os.fspath(path), st.st_mtime_ns, st.st_size
+
+
+def _read_bytes_if_contains(path: str, size: int, needle: bytes) -> bytes | None:
+    """Read a file's bytes, but only if they contain needle.
+
+    Files of at least MMAP_MIN_SIZE are searched in a read-only mmap first,
+    so large files that cannot match are never copied into memory. Smaller
+    files are read outright, which is cheaper than setting up a mapping.
+    """
+    with open(path, "rb") as f:
+        if size < MMAP_MIN_SIZE:
+            content = f.read()
+            return content if needle in content else None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(needle) == -1:
+                return None
+            return mm[:]
+
+
+def _read_json_if_contains(path: Path, needle: bytes) -> Any:
+    """Parse a JSON file, but only if its raw bytes contain needle.
+
+    Returns None if the needle is absent or the file can't be read/parsed.
+    Parses are cached on the file's path, mtime and size, so the same
+    manifest read by several detection steps (or repeated scans in one
+    process) is parsed once. The result is shared: don't mutate it.
+    """
+    key = _file_key(path)
+    return _read_json_cached(*key, needle) if key is not None else None
+
+
+@functools.lru_cache(maxsize=256)
+def _read_json_cached(path: str, mtime_ns: int, size: int, needle: bytes) -> Any:
+    try:
+        content = _read_bytes_if_contains(path, size, needle)
+        return json.loads(content) if content is not None else None
+    except (OSError, ValueError):
+        return None
+
+
+def _read_toml_if_contains(path: Path, needle: bytes) -> dict[str, Any] | None:
+    """Parse a TOML file, but only if its raw bytes contain needle.
 
+    Files that cannot match are never decoded or parsed. Returns None if the
+    needle is absent or the file can't be read/parsed. Cached like
+    _read_json_if_contains; don't mutate the result.
+    """
+    key = _file_key(path)
+    return _read_toml_cached(*key, needle) if key is not None else None
 
-def _detect_packages(repo_path: Path, max_depth: int = 2) -> list[Package]:
-    """Detect packages in non-workspace repos."""
-    packages: list[Package] = []
-    seen_paths: set[Path] = set()
 
-    def scan_dir(path: Path, depth: int = 0) -> None:
-        if depth > max_depth:
-            return
+@functools.lru_cache(maxsize=256)
+def _read_toml_cached(path: str, mtime_ns: int, size: int, needle: bytes) -> dict[str, Any] | None:
+    try:
+        content = _read_bytes_if_contains(path, size, needle)
+        return tomllib.loads(content.decode()) if content is not None else None
+    except (OSError, ValueError):
+        # ValueError covers bad UTF-8 and invalid TOML
+        return None
+
+
+def _scan_workspace_packages(
+    repo_path: Path, workspace_dirs: list[Path], ctx: _DetectionContext
+) -> list[Package]:
+    """Scan known workspace directories for packages."""
+    return _create_packages(repo_path, workspace_dirs, ctx)
+
+
+def _create_packages(
+    repo_path: Path, pkg_paths: list[Path], ctx: _DetectionContext
+) -> list[Package]:
+    """Create packages for candidate directories, preserving their order.
+
+    Runs on a thread pool when there are more than PARALLEL_MIN_PACKAGES
+    candidates, overlapping the filesystem latency of each package.
+    """
+    def create(pkg_path: Path) -> Package | None:
+        return _create_package_fast(repo_path, pkg_path, ctx)
+
+    if len(pkg_paths) > PARALLEL_MIN_PACKAGES:
+        workers = min(MAX_DETECTION_WORKERS, len(pkg_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Each task runs in a copy of our context so _watch still sees
+            # this detection's watched set from the worker threads
+            futures = [
+                executor.submit(contextvars.copy_context().run, create, p) for p in pkg_paths
+            ]
+            results = [future.result() for future in futures]
+    else:
+        results = [create(p) for p in pkg_paths]
+    return [pkg for pkg in results if pkg is not None]
 
-        rel_path = path.relative_to(repo_path) if path != repo_path else Path(".")
 
-        if rel_path in seen_paths:
-            return
+def _detect_packages(
+    repo_path: Path, ctx: _DetectionContext, max_depth: int = 2
+) -> list[Package]:
+    """Detect packages in non-workspace repos.
+
+    Candidate package directories are enumerated serially (cheap) by a
+    breadth-first walk, then packages are created for all candidates at
+    once via _create_packages. Packages are returned sorted by path.
+    """
+    # The walk works on plain strings; Paths are only built for candidates
+    candidates: list[str] = []
+    dirs = ctx.dirs
+    queue: deque[tuple[str, int]] = deque([(os.fspath(repo_path), 0)])
+
+    while queue:
+        path, depth = queue.popleft()
+
+        # The listing is memoized, so the package's own checks reuse it
+        listing = dirs.get(path)
+        names = listing.names
 
         # Check for package manifest (excluding root for workspace detection)
-        has_manifest = False
-        for manifest in PACKAGE_MANIFESTS:
-            if (path / manifest).exists():
-                has_manifest = True
-                # Don't add root if it's a workspace root
-                if depth > 0 or not _is_workspace_root(path):
-                    pkg = _create_package_fast(repo_path, path)
-                    if pkg:
-                        packages.append(pkg)
-                        seen_paths.add(rel_path)
-                break
-
-        # Continue scanning subdirs even if we found a manifest
-        # (for nested packages)
+        if not names.isdisjoint(_MANIFEST_NAMES):
+            is_workspace_root = _is_workspace_root(Path(path), names)
+            # Don't add root if it's a workspace root
+            if depth > 0 or not is_workspace_root:
+                candidates.append(path)
+            # A package below the root owns its subtree unless it is itself
+            # a workspace root; the root keeps scanning to find sibling
+            # packages (polyrepo layout)
+            if depth > 0 and not is_workspace_root:
+                continue
+
         if depth < max_depth:
-            try:
-                for subdir in sorted(path.iterdir()):
-                    if subdir.is_dir() and subdir.name not in SKIP_DIRS:
-                        if subdir.relative_to(repo_path) not in seen_paths:
-                            scan_dir(subdir, depth + 1)
-            except PermissionError:
-                pass
+            queue.extend((subdir, depth + 1) for subdir in listing.subdirs)
 
-    scan_dir(repo_path)
+    pkg_paths = sorted(map(Path, candidates))
+    packages = _create_packages(repo_path, pkg_paths, ctx)
 
     # If no packages found, treat root as single package
     if not packages:
-        pkg = _create_package_fast(repo_path, repo_path)
+        pkg = _create_package_fast(repo_path, repo_path, ctx)
         if pkg:
             packages.append(pkg)
 
     return packages
 
 
-def _is_workspace_root(path: Path) -> bool:
-    """Check if path is a workspace root (has workspaces config)."""
-    pkg_json = path / "package.json"
-    if pkg_json.exists():
-        try:
-            with open(pkg_json) as f:
-                data = json.load(f)
-                if "workspaces" in data:
-                    return True
-        except (json.JSONDecodeError, IOError):
-            pass
+def _is_workspace_root(path: Path, names: frozenset[str]) -> bool:
+    """Check if path (whose entries are names) is a workspace root."""
 
-    if (path / "pnpm-workspace.yaml").exists():
-        return True
-    if (path / "lerna.json").exists():
+    if "pnpm-workspace.yaml" in names or "lerna.json" in names:
         return True
 
-    cargo_toml = path / "Cargo.toml"
-    if cargo_toml.exists():
-        try:
-            if "[workspace]" in cargo_toml.read_text():
-                return True
-        except IOError:
-            pass
+    if "package.json" in names:
+        data = _read_json_if_contains(path / "package.json", b'"workspaces"')
+        if isinstance(data, dict) and "workspaces" in data:
+            return True
+
+    if "Cargo.toml" in names:
+        data = _read_toml_if_contains(path / "Cargo.toml", b"[workspace]")
+        if data is not None and "workspace" in data:
+            return True
 
     return False
 
 
-def _create_package_fast(repo_path: Path, pkg_path: Path) -> Package | None:
+def _create_package_fast(
+    repo_path: Path, pkg_path: Path, ctx: _DetectionContext
+) -> Package | None:
     """Create a Package object with fast detection (no recursive globs)."""
     rel_path = pkg_path.relative_to(repo_path) if pkg_path != repo_path else Path(".")
     name = rel_path.name if rel_path != Path(".") else repo_path.name
@@ -289,30 +596,31 @@ def _create_package_fast(repo_path: Path, pkg_path: Path) -> Package | None:
     # Detect package manager and languages from manifest
     package_manager = None
     langs: set[Language] = set()
+    names = ctx.dirs.get(pkg_path).names
 
-    for manifest, (pm, manifest_langs) in PACKAGE_MANIFESTS.items():
-        if (pkg_path / manifest).exists():
-            package_manager = pm
-            langs.update(manifest_langs)
-            break
+    manifests = names & _MANIFEST_NAMES
+    if manifests:
+        # With several manifests, the first in PACKAGE_MANIFESTS wins
+        package_manager, manifest_langs = PACKAGE_MANIFESTS[min(manifests, key=_MANIFEST_RANK.__getitem__)]
+        langs.update(manifest_langs)
 
     # Enhance language detection by checking for specific files
-    langs.update(_detect_languages_fast(pkg_path, max_depth=2))
+    langs.update(_detect_languages_fast(pkg_path, ctx, max_depth=2))
 
     if not langs:
         return None
 
     # Check for tests (direct check, no glob)
-    has_tests = _has_tests_fast(pkg_path)
+    has_tests = _has_tests_fast(pkg_path, ctx)
 
     # Check for lockfile
-    has_lockfile = any((pkg_path / lf).exists() for lf in LOCKFILES)
+    has_lockfile = not LOCKFILES.isdisjoint(names)
     if not has_lockfile and pkg_path != repo_path:
         # Check root for shared lockfile
-        has_lockfile = any((repo_path / lf).exists() for lf in LOCKFILES)
+        has_lockfile = ctx.has_any_lockfile
 
     # Check for type configs based on detected languages
-    has_types = _has_types_fast(pkg_path, langs, repo_path)
+    has_types = _has_types_fast(pkg_path, langs, repo_path, ctx)
 
     return Package(
         path=rel_path,
@@ -325,133 +633,83 @@ def _create_package_fast(repo_path: Path, pkg_path: Path) -> Package | None:
     )
 
 
-def _detect_languages_fast(path: Path, max_depth: int = 2) -> set[Language]:
+def _detect_languages_fast(
+    path: Path, ctx: _DetectionContext, max_depth: int = 2
+) -> set[Language]:
     """Detect languages without recursive glob (fast)."""
     langs: set[Language] = set()
+    dirs = ctx.dirs
 
     # Check manifest files first
-    if (path / "package.json").exists():
-        langs.add(Language.JAVASCRIPT)
-        if (path / "tsconfig.json").exists():
-            langs.add(Language.TYPESCRIPT)
-    if (path / "pyproject.toml").exists() or (path / "setup.py").exists():
-        langs.add(Language.PYTHON)
-    if (path / "go.mod").exists():
-        langs.add(Language.GO)
-    if (path / "Cargo.toml").exists():
-        langs.add(Language.RUST)
-    if (path / "Gemfile").exists():
-        langs.add(Language.RUBY)
-    if (path / "pom.xml").exists() or (path / "build.gradle").exists():
-        langs.add(Language.JAVA)
-    if (path / "Package.swift").exists():
-        langs.add(Language.SWIFT)
-    if (path / "composer.json").exists():
-        langs.add(Language.PHP)
-    if (path / "mix.exs").exists():
-        langs.add(Language.ELIXIR)
-    if (path / "pubspec.yaml").exists():
-        langs.add(Language.DART)
-
-    # Quick scan of immediate files and first-level subdirs
-    lang_extensions = {
-        ".py": Language.PYTHON,
-        ".js": Language.JAVASCRIPT,
-        ".jsx": Language.JAVASCRIPT,
-        ".ts": Language.TYPESCRIPT,
-        ".tsx": Language.TYPESCRIPT,
-        ".go": Language.GO,
-        ".rs": Language.RUST,
-        ".rb": Language.RUBY,
-        ".java": Language.JAVA,
-        ".kt": Language.KOTLIN,
-        ".swift": Language.SWIFT,
-        ".cs": Language.CSHARP,
-        ".php": Language.PHP,
-        ".ex": Language.ELIXIR,
-        ".exs": Language.ELIXIR,
-        ".dart": Language.DART,
-        ".sol": Language.JAVASCRIPT,  # Solidity often paired with JS tooling
-    }
-
-    def scan_for_extensions(dir_path: Path, depth: int = 0) -> None:
-        if depth > max_depth:
-            return
-        try:
-            for item in dir_path.iterdir():
-                if item.is_file():
-                    ext = item.suffix.lower()
-                    if ext in lang_extensions:
-                        langs.add(lang_extensions[ext])
-                elif item.is_dir() and item.name not in SKIP_DIRS and depth < max_depth:
-                    scan_for_extensions(item, depth + 1)
-        except PermissionError:
-            pass
+    names = dirs.get(path).names
+    for manifest, manifest_langs in _MANIFEST_TO_LANGS.items():
+        if manifest in names:
+            langs |= manifest_langs
+    # tsconfig.json only marks TypeScript alongside a package.json
+    if "package.json" in names and "tsconfig.json" in names:
+        langs.add(Language.TYPESCRIPT)
+
+    # Quick scan of immediate files and subdirs, down to max_depth
+    stack = [(os.fspath(path), 0)]
+    while stack:
+        dir_path, depth = stack.pop()
+        listing = dirs.get(dir_path)
+        langs |= listing.langs
+        # Nothing left to find once every extension language is seen
+        if langs >= _ALL_EXTENSION_LANGS:
+            break
+        if depth < max_depth:
+            stack.extend((subdir, depth + 1) for subdir in listing.subdirs)
 
-    scan_for_extensions(path)
     return langs
 
 
-def _has_tests_fast(pkg_path: Path) -> bool:
+def _has_tests_fast(pkg_path: Path, ctx: _DetectionContext) -> bool:
     """Check for tests without recursive glob."""
-    # Check for test directories
-    for test_dir in TEST_DIRS:
-        if (pkg_path / test_dir).is_dir():
-            return True
+    listing = ctx.dirs.get(pkg_path)
 
-    # Check for common test file patterns in src/
-    src_dir = pkg_path / "src"
-    if src_dir.is_dir():
-        try:
-            for item in src_dir.iterdir():
-                if item.is_file():
-                    name = item.name.lower()
-                    if name.startswith("test_") or name.endswith((".test.ts", ".test.js", ".spec.ts", ".spec.js", "_test.go", "_test.py")):
-                        return True
-        except PermissionError:
-            pass
+    # Check for test directories
+    if not TEST_DIRS.isdisjoint(listing.dir_names):
+        return True
 
-    # Check root for test files
-    try:
-        for item in pkg_path.iterdir():
-            if item.is_file():
-                name = item.name.lower()
-                if name.startswith("test_") or "test" in name or "spec" in name:
-                    if item.suffix in {".py", ".js", ".ts", ".go", ".rs"}:
-                        return True
-    except PermissionError:
-        pass
+    # Check for test files in src/ and at the package root
+    is_test_file = _TEST_FILE_RE.search
+    to_check = [listing]
+    if "src" in listing.dir_names:
+        to_check.insert(0, ctx.dirs.get(os.path.join(os.fspath(pkg_path), "src")))
+    return any(is_test_file(name) for dir_listing in to_check for name in dir_listing.file_names)
 
-    return False
 
-
-def _has_types_fast(pkg_path: Path, langs: set[Language], repo_path: Path) -> bool:
+def _has_types_fast(
+    pkg_path: Path,
+    langs: set[Language],
+    repo_path: Path,
+    ctx: _DetectionContext,
+) -> bool:
     """Check for type configs based on detected languages."""
+    names = ctx.dirs.get(pkg_path).names
+    in_subdir = pkg_path != repo_path
+
     # TypeScript - check for tsconfig
     if Language.TYPESCRIPT in langs or Language.JAVASCRIPT in langs:
-        if (pkg_path / "tsconfig.json").exists():
-            return True
-        if pkg_path != repo_path and (repo_path / "tsconfig.json").exists():
+        if "tsconfig.json" in names or (in_subdir and ctx.root_tsconfig):
             return True
         # Check for tsconfig in parent (monorepo pattern)
-        if (pkg_path / "tsconfig.base.json").exists():
+        if "tsconfig.base.json" in names:
             return True
 
     # Python - check for type configs
     if Language.PYTHON in langs:
-        for tc in ["mypy.ini", ".mypy.ini", "pyrightconfig.json", "py.typed"]:
-            if (pkg_path / tc).exists():
-                return True
-            if pkg_path != repo_path and (repo_path / tc).exists():
-                return True
+        if not names.isdisjoint(TYPE_CONFIGS[Language.PYTHON]):
+            return True
+        if in_subdir and ctx.root_python_type_configs:
+            return True
         # Check pyproject.toml for mypy config
-        pyproject = pkg_path / "pyproject.toml"
-        if pyproject.exists():
-            try:
-                if "[tool.mypy]" in pyproject.read_text():
-                    return True
-            except IOError:
-                pass
+        if "pyproject.toml" in names:
+            data = _read_toml_if_contains(pkg_path / "pyproject.toml", b"[tool.mypy]")
+            tool = data.get("tool") if data is not None else None
+            if isinstance(tool, dict) and "mypy" in tool:
+                return True
 
     # Go and Rust have built-in types
     if Language.GO in langs or Language.RUST in langs:
@@ -460,16 +718,24 @@ def _has_types_fast(pkg_path: Path, langs: set[Language], repo_path: Path) -> bo
     return False
 
 
-def _detect_root_configs(repo_path: Path) -> list[Path]:
+def _detect_root_configs(repo_path: Path, ctx: _DetectionContext) -> list[Path]:
     """Detect shared config files at repository root."""
+    # One listing per directory touched by SHARED_CONFIGS (root, .github),
+    # skipping directories whose parent listing shows they don't exist
+    def listing(parent: str) -> _Listing:
+        head, _, tail = parent.rpartition("/")
+        if parent and tail not in listing(head).dir_names:
+            return _EMPTY_LISTING
+        return ctx.dirs.get(repo_path / parent)
+
     configs: list[Path] = []
     for config_pattern, _ in SHARED_CONFIGS:
-        if config_pattern.endswith("/"):
-            if (repo_path / config_pattern.rstrip("/")).is_dir():
-                configs.append(Path(config_pattern.rstrip("/")))
-        else:
-            if (repo_path / config_pattern).exists():
-                configs.append(Path(config_pattern))
+        is_dir = config_pattern.endswith("/")
+        rel = config_pattern.rstrip("/")
+        parent, _, name = rel.rpartition("/")
+        parent_listing = listing(parent)
+        if name in (parent_listing.dir_names if is_dir else parent_listing.names):
+            configs.append(Path(rel))
     return configs
 
 
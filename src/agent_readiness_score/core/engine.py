@@ -1,16 +1,23 @@
 """Scan engine that orchestrates all scanners with language and package detection."""
 
+import os
+import threading
 import time
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from agent_readiness_score.core.models import (
     ScanReport, CategoryScore, Finding, PackageScore, SharedInfraFinding,
-    RepoStructure, Package, calculate_grade, CATEGORY_WEIGHTS,
+    RepoStructure, Package, calculate_grade, findings_score, CATEGORY_WEIGHTS,
 )
 from agent_readiness_score.core.registry import ScannerRegistry
-from agent_readiness_score.core.language import detect_languages, LanguageStats, Language
+from agent_readiness_score.core.scanner import (
+    Check, Scanner, applicable_checks, as_check, run_all, shared_inventory,
+)
+from agent_readiness_score.core.language import detect_languages, language_mask, LanguageStats, Language
+from agent_readiness_score.core.constants import EXCLUDED_DIRS
 from agent_readiness_score.core.detector import detect_repo_structure, SHARED_CONFIGS
+from agent_readiness_score.core.inventory import PackageInventory
 
 
 # Shared infrastructure bonus weight
@@ -19,21 +26,20 @@ SHARED_CONFIG_WEIGHT = 2.0
 # Critical missing penalty
 CRITICAL_PENALTY = 5.0
 
-# Directories to exclude from scanning (performance optimization)
-EXCLUDED_DIRS = {
-    "node_modules", ".git", "__pycache__", ".venv", "venv", "env",
-    "dist", "build", "target", ".next", ".nuxt", "coverage",
-    ".pytest_cache", ".mypy_cache", ".ruff_cache", "vendor",
-    ".cargo", ".rustup", "Pods", ".gradle", ".idea", ".vscode",
-    ".turbo", ".vercel", ".netlify", "out", ".output",
-}
+# Packages and categories are scanned on a thread pool (the work is
+# filesystem-bound, and scandir/stat release the GIL)
+MAX_SCAN_WORKERS = (os.cpu_count() or 1) * 2
 
 
 class ScanEngine:
     """Orchestrates the scanning process across all categories."""
 
-    def __init__(self, registry: type[ScannerRegistry] | None = None):
+    def __init__(
+        self, registry: type[ScannerRegistry] | None = None, use_cache: bool = False
+    ):
         self.registry = registry or ScannerRegistry
+        # Reuse the repo structure detected by a previous run if unchanged
+        self.use_cache = use_cache
 
     def scan(self, repo_path: Path) -> ScanReport:
         """Scan a repository and generate a complete report.
@@ -57,21 +63,29 @@ class ScanEngine:
 
         start_time = time.perf_counter()
 
-        # Detect repository structure (single, monorepo, polyrepo)
-        repo_structure = detect_repo_structure(repo_path)
-
-        # Detect languages at root level
-        lang_stats = detect_languages(repo_path)
+        # Detect languages at root level while the repository structure
+        # (single, monorepo, polyrepo) is detected: both walks are independent
+        # and mostly wait on readdir, so their directory listings overlap
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            lang_future = executor.submit(detect_languages, repo_path)
+            repo_structure = detect_repo_structure(repo_path, use_cache=self.use_cache)
+            lang_stats = lang_future.result()
 
         # Check shared infrastructure
-        shared_infra = self._check_shared_infrastructure(repo_path)
+        shared_infra = self._check_shared_infrastructure(repo_structure)
 
         # Run scanning based on repo structure
         if repo_structure.is_multi_package and repo_structure.packages:
             # Per-package scanning for multi-package repos
-            package_scores = self._scan_packages(repo_path, repo_structure.packages)
+            # Each searched directory tree is walked once, then queried in
+            # memory; all scanners' wildcard patterns are matched in the
+            # same pass over it
+            inventories = _Inventories(_check_patterns(self.registry.get_all(), lang_stats))
+            package_scores = self._scan_packages(
+                repo_path, repo_structure.packages, inventories
+            )
             category_scores = self._aggregate_package_scores(
-                repo_path, repo_structure, package_scores, shared_infra, lang_stats
+                repo_path, repo_structure, package_scores, shared_infra, lang_stats, inventories
             )
             total_score = self._calculate_multi_package_score(
                 package_scores, shared_infra, repo_path
@@ -79,10 +93,14 @@ class ScanEngine:
         else:
             # Standard scanning for single-package repos
             package_scores = []
-            category_scores = []
-            for scanner in self.registry.get_all():
-                score = scanner.scan(repo_path, lang_stats)
-                category_scores.append(score)
+            # The repo is walked once and every scanner searches that walk;
+            # all scanners' wildcard patterns are matched in one pass over it
+            scanners = self.registry.get_all()
+            with shared_inventory(repo_path) as inventory:
+                inventory.label(_check_patterns(scanners, lang_stats))
+                category_scores = run_all(
+                    scanners, repo_path, lang_stats, max_workers=MAX_SCAN_WORKERS
+                )
             total_score = sum(cs.weighted_score for cs in category_scores)
 
         elapsed_ms = (time.perf_counter() - start_time) * 1000
@@ -93,7 +111,7 @@ class ScanEngine:
             grade=calculate_grade(total_score),
             category_scores=category_scores,
             scan_duration_ms=elapsed_ms,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime()),
             detected_languages=[lang.value for lang in lang_stats.primary_languages()],
             repo_structure=repo_structure,
             package_scores=package_scores,
@@ -101,153 +119,147 @@ class ScanEngine:
         )
 
     def _scan_packages(
-        self, repo_path: Path, packages: list[Package]
+        self, repo_path: Path, packages: list[Package], inventories: "_Inventories"
     ) -> list[PackageScore]:
-        """Scan each package independently."""
-        package_scores: list[PackageScore] = []
-
-        for pkg in packages:
-            pkg_path = repo_path / pkg.path if pkg.path != Path(".") else repo_path
+        """Scan each package independently, in parallel, preserving order."""
+        scanners = self.registry.get_all()
+        # Packages with the same languages run the same checks, so the check
+        # list is built once per language set rather than once per package
+        checks_by_langs: dict[frozenset[Language], list[Check]] = {}
+
+        def scan_one(pkg: Package) -> PackageScore:
+            langs = frozenset(pkg.languages)
+            checks = checks_by_langs.get(langs)
+            if checks is None:
+                checks = checks_by_langs[langs] = self._package_checks(pkg, scanners)
+            return self._scan_package(repo_path, pkg, checks, inventories)
+
+        workers = min(len(packages), MAX_SCAN_WORKERS)
+        if workers <= 1:
+            return [scan_one(pkg) for pkg in packages]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(scan_one, packages))
+
+    def _package_checks(self, pkg: Package, scanners: list[Scanner]) -> list[Check]:
+        """Every scanner's checks that apply within a package with pkg's languages."""
+        pkg_lang_stats = _package_language_stats(pkg)
+        pkg_mask = language_mask(pkg.languages)
+        checks: list[Check] = []
+        for scanner in scanners:
+            for check_tuple in scanner.get_checks(pkg_lang_stats):
+                check = as_check(check_tuple)
+                _, _, _, applicable_langs, scope, _ = check
+
+                # Skip root-only checks for package scanning
+                if scope == "root":
+                    continue
 
-            # Create language stats for this package
-            pkg_lang_stats = LanguageStats()
-            for lang in pkg.languages:
-                pkg_lang_stats.add_language(lang, 1000)  # Approximate
-
-            # Run scanners on this package
-            pkg_findings: list[Finding] = []
-            total_weight = 0.0
-            weighted_found = 0.0
-
-            for scanner in self.registry.get_all():
-                checks = scanner.get_checks(pkg_lang_stats)
-                for check_tuple in checks:
-                    # Handle both formats
-                    if len(check_tuple) == 4:
-                        check_name, patterns, weight, applicable_langs = check_tuple
-                        scope = "any"
-                    else:
-                        check_name, patterns, weight, applicable_langs, scope, _ = check_tuple
-
-                    # Skip root-only checks for package scanning
-                    if scope == "root":
+                # Skip checks that don't apply to this package's languages
+                if applicable_langs is not None:
+                    if not language_mask(applicable_langs) & pkg_mask:
                         continue
 
-                    # Skip checks that don't apply to this package's languages
-                    if applicable_langs is not None:
-                        if not any(lang in pkg.languages for lang in applicable_langs):
-                            continue
+                checks.append(check)
+        return checks
+
+    def _scan_package(
+        self,
+        repo_path: Path,
+        pkg: Package,
+        checks: list[Check],
+        inventories: "_Inventories",
+    ) -> PackageScore:
+        """Run the package-level checks against one package."""
+        pkg_rel = pkg.path
+        pkg_path = repo_path / pkg_rel if pkg_rel != Path(".") else repo_path
+        # Looked up once here rather than by path for every check
+        pkg_inventory = inventories.get(pkg_path)
+        root_inventory = inventories.get(repo_path)
+
+        pkg_findings: list[Finding] = []
+        total_weight = 0.0
+        weighted_found = 0.0
+
+        for check_name, patterns, weight, _, _, _ in checks:
+            # Search in package directory
+            found_path = self._find_in_package(
+                pkg_rel, patterns, pkg_inventory, root_inventory
+            )
 
-                    # Search in package directory
-                    found_path = self._find_in_package(pkg_path, repo_path, patterns)
-
-                    pkg_findings.append(Finding(
-                        name=check_name,
-                        found=found_path is not None,
-                        path=found_path,
-                        weight=weight,
-                    ))
-
-                    total_weight += weight
-                    if found_path is not None:
-                        weighted_found += weight
-
-            # Calculate package score
-            if total_weight > 0:
-                pkg_score = (weighted_found / total_weight) * 100
-            else:
-                pkg_score = 0.0
-
-            package_scores.append(PackageScore(
-                package=pkg,
-                score=pkg_score,
-                findings=pkg_findings,
+            pkg_findings.append(Finding(
+                name=check_name,
+                found=found_path is not None,
+                path=found_path,
+                weight=weight,
             ))
 
-        return package_scores
+            total_weight += weight
+            if found_path is not None:
+                weighted_found += weight
+
+        # Calculate package score
+        if total_weight > 0:
+            pkg_score = (weighted_found / total_weight) * 100
+        else:
+            pkg_score = 0.0
+
+        return PackageScore(
+            package=pkg,
+            score=pkg_score,
+            findings=pkg_findings,
+        )
 
     def _find_in_package(
-        self, pkg_path: Path, repo_path: Path, patterns: list[str]
+        self,
+        pkg_rel: Path,
+        patterns: list[str],
+        pkg_inventory: PackageInventory | None,
+        root_inventory: PackageInventory | None,
     ) -> Path | None:
-        """Find a file matching patterns within a package, including subdirs and root."""
-        # First check in package directory (direct patterns)
-        for pattern in patterns:
-            if "**" not in pattern:
-                # Direct pattern - check package root
-                for match in pkg_path.glob(pattern):
-                    if not self._is_excluded(match):
-                        try:
-                            return match.relative_to(repo_path)
-                        except ValueError:
-                            return match
-
-        # Check subdirectories within package (max 2 levels deep for performance)
-        for pattern in patterns:
-            if "**" in pattern:
-                continue  # Skip recursive patterns, handle manually
-            # Search in immediate subdirs
-            result = self._search_with_depth(pkg_path, pattern, repo_path, max_depth=2)
-            if result:
-                return result
+        """Find a file matching patterns within a package, including subdirs and root.
+
+        pkg_rel is the package's path relative to the repo root; matches are
+        returned relative to the repo root.
+        """
+        # First check in package directory (direct patterns), then
+        # subdirectories within package (max 2 levels deep for performance)
+        for root_only in (True, False):
+            rel = self._first_match(pkg_inventory, patterns, root_only)
+            if rel is not None:
+                return pkg_rel / rel
 
         # Also check root for shared configs
-        for pattern in patterns:
-            if "**" not in pattern:
-                for match in repo_path.glob(pattern):
-                    if not self._is_excluded(match):
-                        try:
-                            return match.relative_to(repo_path)
-                        except ValueError:
-                            return match
-
-        return None
-
-    def _search_with_depth(
-        self, base_path: Path, pattern: str, repo_path: Path, max_depth: int = 2
-    ) -> Path | None:
-        """Search for pattern in base_path and subdirs up to max_depth."""
-        # Check base first
-        for match in base_path.glob(pattern):
-            if not self._is_excluded(match):
-                try:
-                    return match.relative_to(repo_path)
-                except ValueError:
-                    return match
-
-        # Check subdirectories
-        if max_depth > 0:
-            try:
-                for subdir in base_path.iterdir():
-                    if subdir.is_dir() and subdir.name not in EXCLUDED_DIRS:
-                        result = self._search_with_depth(
-                            subdir, pattern, repo_path, max_depth - 1
-                        )
-                        if result:
-                            return result
-            except PermissionError:
-                pass
-
-        return None
-
-    def _is_excluded(self, path: Path) -> bool:
-        """Check if path is in an excluded directory."""
-        return any(excluded in path.parts for excluded in EXCLUDED_DIRS)
-
-    def _check_shared_infrastructure(self, repo_path: Path) -> list[SharedInfraFinding]:
-        """Check for shared infrastructure at repo root."""
+        rel = self._first_match(root_inventory, patterns, root_only=True)
+        return Path(rel) if rel is not None else None
+
+    def _first_match(
+        self, inventory: PackageInventory | None, patterns: list[str], root_only: bool
+    ) -> str | None:
+        """First match of patterns (in order) that isn't in an excluded directory.
+
+        Recursive (**) patterns are skipped. Directories inside excluded
+        ones have no inventory (see _Inventories.get); the inventory's walk
+        prunes excluded directories below its root.
+        """
+        if inventory is None:
+            return None
+        return inventory.first_match([p for p in patterns if "**" not in p], root_only)
+
+    def _check_shared_infrastructure(
+        self, repo_structure: RepoStructure
+    ) -> list[SharedInfraFinding]:
+        """Check for shared infrastructure at repo root.
+
+        Uses the root configs found during structure detection, which lists
+        the root (and .github) once instead of probing every config path.
+        """
         findings: list[SharedInfraFinding] = []
+        root_configs = set(repo_structure.root_configs)
 
         for config_pattern, name in SHARED_CONFIGS:
-            if config_pattern.endswith("/"):
-                # Directory check
-                dir_path = repo_path / config_pattern.rstrip("/")
-                found = dir_path.is_dir()
-                path = Path(config_pattern.rstrip("/")) if found else None
-            else:
-                # File check
-                file_path = repo_path / config_pattern
-                found = file_path.exists()
-                path = Path(config_pattern) if found else None
+            config_path = Path(config_pattern.rstrip("/"))
+            found = config_path in root_configs
+            path = config_path if found else None
 
             findings.append(SharedInfraFinding(
                 name=name,
@@ -264,107 +276,125 @@ class ScanEngine:
         package_scores: list[PackageScore],
         shared_infra: list[SharedInfraFinding],
         lang_stats: LanguageStats,
+        inventories: "_Inventories",
     ) -> list[CategoryScore]:
-        """Aggregate package scores into category scores for display."""
+        """Aggregate package scores into category scores for display.
+
+        Categories are independent, so they are scored in parallel.
+        """
         # For multi-package repos, we still want category breakdown
         # Run standard scanning but with awareness of packages
-        category_scores = []
+        scanners = self.registry.get_all()
+        # Package directories, language masks and inventories, looked up
+        # once for all checks
+        packages = []
+        for pkg in repo_structure.packages:
+            pkg_path = repo_path / pkg.path if pkg.path != Path(".") else repo_path
+            packages.append((pkg_path, language_mask(pkg.languages), inventories.get(pkg_path)))
 
-        for scanner in self.registry.get_all():
-            # Combine findings from all packages for this category
-            all_findings: list[Finding] = []
-            checks = scanner.get_checks(lang_stats)
+        def score_one(scanner: Scanner) -> CategoryScore:
+            return self._aggregate_category(
+                repo_path, packages, scanner, lang_stats, inventories
+            )
 
-            for check_tuple in checks:
-                if len(check_tuple) == 4:
-                    check_name, patterns, weight, applicable_langs = check_tuple
-                    scope = "any"
-                else:
-                    check_name, patterns, weight, applicable_langs, scope, _ = check_tuple
+        workers = min(len(scanners), MAX_SCAN_WORKERS)
+        if workers <= 1:
+            return [score_one(scanner) for scanner in scanners]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(score_one, scanners))
 
-                # Handle scope-based searching
-                found_path = None
+    def _aggregate_category(
+        self,
+        repo_path: Path,
+        packages: list[tuple[Path, int, PackageInventory | None]],
+        scanner: Scanner,
+        lang_stats: LanguageStats,
+        inventories: "_Inventories",
+    ) -> CategoryScore:
+        """Score one category across the repo root and its packages.
 
-                if scope == "root":
-                    # Only check root
-                    found_path = self._find_at_root(repo_path, patterns)
-                elif scope == "package":
-                    # Check all packages
-                    for pkg in repo_structure.packages:
-                        pkg_path = repo_path / pkg.path if pkg.path != Path(".") else repo_path
-                        # Check language applicability
-                        if applicable_langs is not None:
-                            if not any(lang in pkg.languages for lang in applicable_langs):
-                                continue
-                        found_path = self._find_at_root(pkg_path, patterns)
+        packages holds each package's directory, language mask and inventory.
+        """
+        # Combine findings from all packages for this category
+        all_findings: list[Finding] = []
+        root_inventory = inventories.get(repo_path)
+        checks = scanner.get_checks(lang_stats)
+        repo_mask = language_mask(
+            lang for lang, count in lang_stats.languages.items() if count > 0
+        ) if lang_stats is not None else None
+
+        for check_tuple in checks:
+            check_name, patterns, weight, applicable_langs, scope, _ = as_check(check_tuple)
+            check_mask = None if applicable_langs is None else language_mask(applicable_langs)
+
+            # Skip checks that don't apply (before searching for them)
+            if check_mask is not None and repo_mask is not None:
+                if not check_mask & repo_mask:
+                    continue
+
+            # Handle scope-based searching
+            found_path = None
+
+            if scope == "root":
+                # Only check root
+                found_path = self._find_at_root(repo_path, patterns, root_inventory)
+            elif scope == "package":
+                # Check all packages
+                for pkg_path, pkg_mask, pkg_inventory in packages:
+                    # Check language applicability
+                    if check_mask is not None and not check_mask & pkg_mask:
+                        continue
+                    found_path = self._find_at_root(pkg_path, patterns, pkg_inventory)
+                    if found_path:
+                        break
+            else:  # scope == "any"
+                # Check root first, then packages
+                found_path = self._find_at_root(repo_path, patterns, root_inventory)
+                if not found_path:
+                    for pkg_path, pkg_mask, pkg_inventory in packages:
+                        if check_mask is not None and not check_mask & pkg_mask:
+                            continue
+                        found_path = self._find_at_root(pkg_path, patterns, pkg_inventory)
                         if found_path:
+                            try:
+                                found_path = found_path.relative_to(repo_path)
+                            except ValueError:
+                                pass
                             break
-                else:  # scope == "any"
-                    # Check root first, then packages
-                    found_path = self._find_at_root(repo_path, patterns)
-                    if not found_path:
-                        for pkg in repo_structure.packages:
-                            pkg_path = repo_path / pkg.path if pkg.path != Path(".") else repo_path
-                            if applicable_langs is not None:
-                                if not any(lang in pkg.languages for lang in applicable_langs):
-                                    continue
-                            found_path = self._find_at_root(pkg_path, patterns)
-                            if found_path:
-                                try:
-                                    found_path = found_path.relative_to(repo_path)
-                                except ValueError:
-                                    pass
-                                break
-
-                # Skip checks that don't apply
-                if applicable_langs is not None and lang_stats is not None:
-                    if not any(lang_stats.has_language(lang) for lang in applicable_langs):
-                        continue
 
-                all_findings.append(Finding(
-                    name=check_name,
-                    found=found_path is not None,
-                    path=found_path,
-                    weight=weight,
-                ))
-
-            # Calculate category score
-            total_weight = sum(f.weight for f in all_findings)
-            if total_weight > 0:
-                weighted_found = sum(f.weight for f in all_findings if f.found)
-                score = (weighted_found / total_weight) * 100
-            else:
-                score = 0.0
-
-            category_weight = CATEGORY_WEIGHTS[scanner.category]
-
-            category_scores.append(CategoryScore(
-                category=scanner.category,
-                score=score,
-                weight=category_weight,
-                weighted_score=score * category_weight,
-                findings=all_findings,
+            all_findings.append(Finding(
+                name=check_name,
+                found=found_path is not None,
+                path=found_path,
+                weight=weight,
             ))
 
-        return category_scores
+        # Calculate category score
+        score = findings_score(all_findings)
+
+        category_weight = CATEGORY_WEIGHTS[scanner.category]
 
-    def _find_at_root(self, path: Path, patterns: list[str], max_depth: int = 2) -> Path | None:
-        """Find a file matching patterns at a specific path with limited recursion."""
+        return CategoryScore(
+            category=scanner.category,
+            score=score,
+            weight=category_weight,
+            weighted_score=score * category_weight,
+            findings=all_findings,
+        )
+
+    def _find_at_root(
+        self, path: Path, patterns: list[str], inventory: PackageInventory | None
+    ) -> Path | None:
+        """Find a file matching patterns at a specific path (whose inventory
+        is given) with limited recursion."""
         # Check direct patterns first
-        for pattern in patterns:
-            if "**" not in pattern:
-                for match in path.glob(pattern):
-                    if not self._is_excluded(match):
-                        return match
+        rel = self._first_match(inventory, patterns, root_only=True)
+        if rel is not None:
+            return path / rel
 
         # Search subdirs with depth limit
-        for pattern in patterns:
-            if "**" not in pattern:
-                result = self._search_with_depth(path, pattern, path, max_depth=max_depth)
-                if result:
-                    return result
-
-        return None
+        rel = self._first_match(inventory, patterns, root_only=False)
+        return Path(rel) if rel is not None else None
 
     def _calculate_multi_package_score(
         self,
@@ -376,27 +406,89 @@ class ScanEngine:
         if not package_scores:
             return 0.0
 
-        # Base: weighted average of package scores
-        total_weight = sum(ps.weight for ps in package_scores)
+        # Base: weighted average of package scores (each package's weight is
+        # derived from its size on every read, so read it once)
+        scores = [ps.score for ps in package_scores]
+        weights = [ps.weight for ps in package_scores]
+        total_weight = sum(weights)
         if total_weight > 0:
-            base_score = sum(ps.score * ps.weight for ps in package_scores) / total_weight
+            base_score = sum(s * w for s, w in zip(scores, weights, strict=True)) / total_weight
         else:
-            base_score = sum(ps.score for ps in package_scores) / len(package_scores)
+            base_score = sum(scores) / len(scores)
 
         # Bonus: shared configs that benefit all packages
         shared_found = sum(1 for si in shared_infra if si.found)
         shared_bonus = min(shared_found * SHARED_CONFIG_WEIGHT, 15.0)  # Cap at 15 points
 
-        # Penalty: critical missing items
+        # Penalty: critical missing items, answered from the root configs
+        # already found for shared infrastructure
+        root_configs = {si.path for si in shared_infra if si.found}
         critical_missing = 0
         # Check for README
-        if not (repo_path / "README.md").exists():
+        if Path("README.md") not in root_configs:
             critical_missing += 1
         # Check for CI
-        if not (repo_path / ".github" / "workflows").is_dir():
-            if not list(repo_path.glob(".github/workflows/*.yml")):
-                critical_missing += 1
+        if Path(".github/workflows") not in root_configs:
+            critical_missing += 1
 
         critical_penalty = critical_missing * CRITICAL_PENALTY
 
         return min(100.0, max(0.0, base_score + shared_bonus - critical_penalty))
+
+
+def _package_language_stats(pkg: Package) -> LanguageStats:
+    """Approximate LanguageStats for a package from its detected languages."""
+    languages = dict.fromkeys(sorted(pkg.languages), 1000)  # Approximate
+    if not languages:
+        return LanguageStats(
+            primary=Language.UNKNOWN, languages={}, total_files=0, confidence=0.0
+        )
+    return LanguageStats(
+        primary=next(iter(languages)),
+        languages=languages,
+        total_files=sum(languages.values()),
+        confidence=1 / len(languages),
+    )
+
+
+def _check_patterns(scanners: list[Scanner], lang_stats: LanguageStats) -> list[str]:
+    """Every file pattern of every scanner's checks that apply to the repo's
+    languages, for PackageInventory.label."""
+    return [
+        pattern
+        for scanner in scanners
+        for check_tuple in applicable_checks(scanner.get_checks(lang_stats), lang_stats)
+        for pattern in check_tuple[1]
+    ]
+
+
+class _Inventories:
+    """PackageInventory for each directory searched during one scan.
+
+    Inventories are built on first use, once per directory even when
+    several threads ask for the same one, and labeled with patterns.
+    """
+
+    def __init__(self, patterns: list[str] | None = None) -> None:
+        self._patterns = patterns or []
+        self._inventories: dict[Path, PackageInventory | None] = {}
+        self._locks: dict[Path, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: Path) -> PackageInventory | None:
+        """The inventory of path, or None if path is inside an excluded
+        directory (it is then never searched, or walked)."""
+        try:
+            return self._inventories[path]
+        except KeyError:
+            pass
+        with self._lock:
+            path_lock = self._locks.setdefault(path, threading.Lock())
+        with path_lock:
+            if path not in self._inventories:
+                inventory = None
+                if EXCLUDED_DIRS.isdisjoint(path.parts):
+                    inventory = PackageInventory(path, EXCLUDED_DIRS)
+                    inventory.label(self._patterns)
+                self._inventories[path] = inventory
+        return self._inventories[path]
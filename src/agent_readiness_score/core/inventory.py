@@ -0,0 +1,318 @@
+"""In-memory file inventory of a package, for answering check patterns."""
+
+import fnmatch
+import functools
+import operator
+import os
+import re
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence, Set
+from pathlib import Path
+from typing import NamedTuple
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+@functools.lru_cache(maxsize=256)
+def glob_matcher(pattern: str) -> Callable[[str], object]:
+    """Return a predicate matching names against a single-segment glob.
+
+    Compiled once per pattern. Like Path.glob on POSIX, matching is
+    case-sensitive and * also matches leading dots. Patterns with a single
+    leading or trailing * ("*.ext", "Dockerfile.*") skip the regex and
+    compare a suffix or prefix.
+    """
+    if pattern.startswith("*") and _GLOB_CHARS.isdisjoint(pattern[1:]):
+        return operator.methodcaller("endswith", pattern[1:])
+    if pattern.endswith("*") and _GLOB_CHARS.isdisjoint(pattern[:-1]):
+        return operator.methodcaller("startswith", pattern[:-1])
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+@functools.lru_cache(maxsize=32)
+def _any_glob_matcher(patterns: tuple[str, ...]) -> Callable[[str], object]:
+    """Return a predicate matching names against any of the globs, in one regex."""
+    return re.compile("|".join(map(fnmatch.translate, patterns))).match
+
+
+class _Entry(NamedTuple):
+    """A directory entry, typed as Path.glob would see it (following symlinks)."""
+    name: str
+    is_dir: bool
+    exists: bool  # False for broken symlinks
+    is_symlink: bool
+
+
+def _list_entries(path: str) -> list[_Entry]:
+    """List a directory in scandir order; missing/unreadable dirs are empty."""
+    try:
+        with os.scandir(path) as it:
+            raw = list(it)
+    except OSError:
+        return []
+
+    entries: list[_Entry] = []
+    for entry in raw:
+        try:
+            is_symlink = entry.is_symlink()
+            is_dir = entry.is_dir()
+            exists = is_dir or not is_symlink or os.path.exists(entry.path)
+        except OSError:
+            is_dir, exists, is_symlink = False, False, False
+        entries.append(_Entry(entry.name, is_dir, exists, is_symlink))
+    return entries
+
+
+def _everywhere_glob(segments: tuple[str, ...], root_only: bool) -> str | None:
+    """The wildcard name a query matches in every inventoried directory, if
+    that's all it does: "*.proto" (not root_only) or "**/*.proto" (root_only)."""
+    if root_only:
+        if len(segments) != 2 or segments[0] != "**":
+            return None
+        name = segments[1]
+    elif len(segments) == 1:
+        name = segments[0]
+    else:
+        return None
+    return None if _GLOB_CHARS.isdisjoint(name) or name == "**" else name
+
+
+class _Pattern(NamedTuple):
+    """A check pattern, parsed and compiled once (see _parse_pattern)."""
+    name: str | None  # Set for plain names ("README.md", "docs/")
+    dir_only: bool
+    segments: tuple[str, ...]
+    last: int  # Index of the last segment that names something
+    matchers: tuple[Callable[[str], object] | None, ...]  # None for literals and **
+    everywhere: tuple[str | None, str | None]  # _everywhere_glob, by root_only
+
+
+# Patterns come from the scanners' check lists, a fixed set, so every one
+# stays compiled for the life of the process
+@functools.cache
+def _parse_pattern(pattern: str) -> _Pattern:
+    """Parse a check pattern once.
+
+    A pattern is a plain name when it has no wildcards and no directory
+    part ("README.md", "docs/"); anything else is matched segment by
+    segment (".github/workflows/*.yml"), each wildcard segment with its own
+    precompiled matcher.
+    """
+    segments = tuple(pattern.split("/"))
+    dir_only = pattern.endswith("/")
+    last = len(segments) - 1 - dir_only
+    name = segments[0] if _GLOB_CHARS.isdisjoint(pattern) and last == 0 else None
+    matchers = tuple(
+        None if segment == "**" or _GLOB_CHARS.isdisjoint(segment) else glob_matcher(segment)
+        for segment in segments
+    )
+    everywhere = (_everywhere_glob(segments, False), _everywhere_glob(segments, True))
+    return _Pattern(name, dir_only, segments, last, matchers, everywhere)
+
+
+class PackageInventory:
+    """Every file and directory of a package down to max_depth, from one walk.
+
+    Pattern lookups are then answered from memory: plain names are a dict
+    lookup and wildcards are matched against the cached listings. Results
+    come in the order a depth-first search would find them, so the first
+    match is the same one a walk (globbing each directory in turn) would
+    return. Matches are "/"-separated strings relative to root; the walk
+    tracks them as it descends instead of doing Path arithmetic.
+
+    A ** segment matches the inventoried directories below a point, i.e. it
+    stops at skip_dirs and max_depth (None for no limit). With
+    follow_symlinks=False, symlinked directories are listed but not
+    walked, like pathlib's **; an unlimited walk needs that to avoid
+    symlink cycles.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        skip_dirs: Set[str],
+        max_depth: int | None = 2,
+        follow_symlinks: bool = True,
+    ):
+        self.root = root
+        self._root = os.fspath(root)
+        # Directories in depth-first pre-order, starting with root ("")
+        self.dirs: list[str] = []
+        self._dir_index: dict[str, int] = {}
+        self.entries_by_name: dict[str, list[str]] = {}
+        self.dirs_by_name: dict[str, list[str]] = {}
+        self._listings: dict[str, list[_Entry]] = {}
+        # Wildcard name -> matching entries in all inventoried dirs (see label)
+        self._labels: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+        self._skip_dirs = skip_dirs
+        self._first_matches: dict[tuple[tuple[str, ...], bool], str | None] = {}
+
+        stack: list[tuple[str, int]] = [("", 0)]
+        while stack:
+            rel, depth = stack.pop()
+            self._dir_index[rel] = len(self.dirs)
+            self.dirs.append(rel)
+            prefix = rel + "/" if rel else ""
+            subdirs: list[str] = []
+            for entry in self._listing(rel):
+                if not entry.exists:
+                    continue
+                child = prefix + entry.name
+                self.entries_by_name.setdefault(entry.name, []).append(child)
+                if entry.is_dir:
+                    self.dirs_by_name.setdefault(entry.name, []).append(child)
+                    if (
+                        (max_depth is None or depth < max_depth)
+                        and entry.name not in skip_dirs
+                        and (follow_symlinks or not entry.is_symlink)
+                    ):
+                        subdirs.append(child)
+            # Reversed so directories are visited in listing order
+            stack.extend((subdir, depth + 1) for subdir in reversed(subdirs))
+
+        # Plain names at root are a dict lookup, like a stat of root/name
+        self._root_entries = {entry.name: entry for entry in self._listing("")}
+
+    def matches(self, pattern: str, root_only: bool = False) -> Iterator[str]:
+        """Yield paths (relative to root) matching pattern relative to root
+        or, unless root_only, any inventoried directory, in depth-first order."""
+        parsed = _parse_pattern(pattern)
+        name = parsed.name
+        if name is not None:
+            if root_only:
+                entry = self._root_entries.get(name)
+                if entry is not None and (entry.is_dir if parsed.dir_only else entry.exists):
+                    yield name
+            else:
+                index = self.dirs_by_name if parsed.dir_only else self.entries_by_name
+                yield from index.get(name, ())
+            return
+
+        everywhere = parsed.everywhere[root_only]
+        if everywhere is not None:
+            labeled = self._labels.get(everywhere)
+            if labeled is not None:
+                yield from labeled
+                return
+
+        if root_only:
+            yield from self._glob("", parsed, 0)
+        elif parsed.matchers[0] is None and parsed.segments[0] != "**":
+            # A literal first directory (".github/workflows/*.yml") is only
+            # searched below the directories of that name, not from every one
+            for directory in self.dirs_by_name.get(parsed.segments[0], ()):
+                yield from self._glob(directory, parsed, 1)
+        else:
+            for directory in self.dirs:
+                yield from self._glob(directory, parsed, 0)
+
+    def first_match(self, patterns: Sequence[str], root_only: bool = False) -> str | None:
+        """The first match of patterns (tried in order) that isn't in, or
+        itself named like, one of skip_dirs.
+
+        Remembered per (patterns, root_only): the same check patterns are
+        searched by several scanners, and per package for both the package
+        and its category scores.
+        """
+        key = (tuple(patterns), root_only)
+        try:
+            return self._first_matches[key]
+        except KeyError:
+            pass
+
+        result = None
+        skip_dirs = self._skip_dirs
+        for pattern in key[0]:
+            for rel in self.matches(pattern, root_only):
+                if skip_dirs.isdisjoint(rel.split("/")):
+                    result = rel
+                    break
+            if result is not None:
+                break
+        self._first_matches[key] = result
+        return result
+
+    def label(self, patterns: Iterable[str]) -> None:
+        """Precompute the matches of patterns' wildcard names in every directory.
+
+        Patterns like "*.proto" (searched in every directory) or
+        "**/logger*.py" are otherwise matched against each listing in turn,
+        one pattern at a time. Here they're folded into one regex and every
+        inventoried entry is tested once; only the entries that match some
+        pattern are then tested against each one. Other patterns are ignored.
+        """
+        names: dict[str, None] = {}
+        for pattern in patterns:
+            for name in _parse_pattern(pattern).everywhere:
+                if name is not None and name not in self._labels:
+                    names[name] = None
+        if not names:
+            return
+
+        any_match = _any_glob_matcher(tuple(names))
+        matchers: list[tuple[str, Callable[[str], object], list[str]]] = [
+            (name, glob_matcher(name), []) for name in names
+        ]
+        for directory in self.dirs:
+            prefix = directory + "/" if directory else ""
+            for entry in self._listing(directory):
+                if any_match(entry.name):
+                    for _, match, hits in matchers:
+                        if match(entry.name):
+                            hits.append(prefix + entry.name)
+
+        with self._lock:
+            for name, _, hits in matchers:
+                self._labels.setdefault(name, hits)
+
+    def _glob(self, directory: str, pattern: _Pattern, index: int) -> Iterator[str]:
+        """Match pattern's segments from index on against cached listings,
+        like Path.glob."""
+        segment = pattern.segments[index]
+        last = index == pattern.last
+        if segment == "**":
+            for subdir in self._subtree(directory):
+                if last:
+                    yield subdir
+                else:
+                    yield from self._glob(subdir, pattern, index + 1)
+            return
+
+        match = pattern.matchers[index]
+        prefix = directory + "/" if directory else ""
+
+        for entry in self._listing(directory):
+            if match is None:
+                if entry.name != segment:
+                    continue
+            elif not match(entry.name):
+                continue
+
+            if not last:
+                if entry.is_dir:
+                    yield from self._glob(prefix + entry.name, pattern, index + 1)
+            elif entry.is_dir if pattern.dir_only else (entry.exists or match is not None):
+                yield prefix + entry.name
+
+    def _subtree(self, rel: str) -> list[str]:
+        """rel and the inventoried directories below it, in depth-first order."""
+        start = self._dir_index.get(rel)
+        if start is None:
+            # Not walked (skipped or past max_depth): only rel itself
+            return [rel]
+        # Pre-order keeps each subtree contiguous
+        prefix = rel + "/" if rel else ""
+        end = start + 1
+        while end < len(self.dirs) and self.dirs[end].startswith(prefix):
+            end += 1
+        return self.dirs[start:end]
+
+    def _listing(self, rel: str) -> list[_Entry]:
+        """Memoized listing of root/rel (also covers dirs below max_depth)."""
+        listing = self._listings.get(rel)
+        if listing is None:
+            listing = _list_entries(os.path.join(self._root, rel) if rel else self._root)
+            with self._lock:
+                listing = self._listings.setdefault(rel, listing)
+        return listing
@@ -1,9 +1,15 @@
 """Language detection for repository analysis."""
 
+import os
 from collections import Counter
+from collections.abc import Iterable, Iterator, Set
+from dataclasses import dataclass, field
 from enum import Enum
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from dataclasses import dataclass
+
+from agent_readiness_score.core.constants import EXCLUDED_DIRS
 
 
 class Language(str, Enum):
@@ -92,28 +98,44 @@ EXTENSION_MAP: dict[str, Language] = {
     ".zig": Language.ZIG,
 }
 
-# Directories to skip during detection
-SKIP_DIRS = {
-    "__pycache__", ".git", ".svn", ".hg",
-    "node_modules", ".venv", "venv", "env",
-    "build", "dist", "target", "out", "bin", "obj",
-    ".pytest_cache", ".mypy_cache", ".ruff_cache",
-    "vendor", "deps", "_build", ".bundle",
-    ".next", ".nuxt", ".output",
+# Longest key in EXTENSION_MAP (".gemspec"); longer suffixes can't match
+_MAX_EXTENSION_LENGTH = max(map(len, EXTENSION_MAP))
+
+# Directories to skip during detection. Walks prune these by name when
+# listing a directory, so nothing below them is ever enumerated. On top of
+# EXCLUDED_DIRS, language counting also skips other VCS metadata and
+# compiled or fetched output that isn't the repo's own source.
+SKIP_DIRS: frozenset[str] = EXCLUDED_DIRS | {
+    ".svn", ".hg", "bin", "obj", "deps", "_build", ".bundle",
 }
 
+# One bit per language, so language sets can be intersected with a single AND
+_LANGUAGE_BITS: dict[Language, int] = {lang: 1 << i for i, lang in enumerate(Language)}
+
 # Threshold for considering a language "significant" in the repo
 SIGNIFICANT_LANGUAGE_THRESHOLD = 0.1  # 10% of files
 
 
 @dataclass
 class LanguageStats:
-    """Statistics about detected languages."""
+    """Statistics about detected languages.
+
+    The per-language queries below are answered from views of languages
+    computed once at construction; languages is not modified afterwards.
+    """
 
     primary: Language
     languages: dict[Language, int]  # Language -> file count
     total_files: int
     confidence: float  # 0-1, how dominant the primary language is
+    # Languages with at least one file
+    _present: frozenset[Language] = field(init=False, repr=False, compare=False)
+    # (language, count) pairs, most files first (ties in insertion order)
+    _ranked: tuple[tuple[Language, int], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._present = frozenset(lang for lang, count in self.languages.items() if count > 0)
+        self._ranked = tuple(sorted(self.languages.items(), key=itemgetter(1), reverse=True))
 
     @property
     def is_multi_language(self) -> bool:
@@ -128,7 +150,11 @@ class LanguageStats:
 
     def has_language(self, lang: Language) -> bool:
         """Check if a language is present in the repo."""
-        return lang in self.languages and self.languages[lang] > 0
+        return lang in self._present
+
+    def has_any_language(self, langs: Iterable[Language]) -> bool:
+        """Check if any of langs is present in the repo."""
+        return not self._present.isdisjoint(langs)
 
     def language_ratio(self, lang: Language) -> float:
         """Get the ratio of files for a language (0-1)."""
@@ -148,13 +174,69 @@ class LanguageStats:
         if self.total_files == 0:
             return []
 
-        significant = [
-            (lang, count) for lang, count in self.languages.items()
+        return [
+            lang for lang, count in self._ranked
             if count / self.total_files >= threshold
         ]
-        # Sort by count descending
-        significant.sort(key=lambda x: x[1], reverse=True)
-        return [lang for lang, _ in significant]
+
+
+def walk_files(root: Path, skip_dirs: Set[str] = SKIP_DIRS) -> Iterator[os.DirEntry[str]]:
+    """Yield the files under root, depth-first.
+
+    Directories named in skip_dirs are pruned before they are entered
+    (rather than walked and filtered afterwards), entry types come from the
+    directory listing, and symlinked directories aren't followed. Callers
+    looking for a first match can simply stop iterating.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs: list[str] = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in skip_dirs:
+                    subdirs.append(entry.path)
+            elif entry.is_file():
+                yield entry
+        # Reversed so directories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+
+def _ext_of(name: str) -> str | None:
+    """Lowercased extension of name, or None if it can't be in EXTENSION_MAP.
+
+    Same extension as os.path.splitext: dotfiles like ".py" have none.
+    Suffixes longer than any known extension aren't lowercased at all.
+    """
+    dot = name.rfind(".")
+    if dot <= 0 or len(name) - dot > _MAX_EXTENSION_LENGTH:
+        return None
+    return name[dot:].lower()
+
+
+def _walk_languages(root: Path) -> Iterator[Language]:
+    """Yield the language of each recognized source file under root."""
+    extension_map = EXTENSION_MAP
+    for entry in walk_files(root):
+        ext = _ext_of(entry.name)
+        if ext is None:
+            continue
+        lang = extension_map.get(ext)
+        if lang is not None:
+            yield lang
+
+
+def language_mask(langs: Iterable[Language]) -> int:
+    """Bitmask of langs; two sets of languages overlap iff their masks AND to non-zero."""
+    mask = 0
+    for lang in langs:
+        mask |= _LANGUAGE_BITS[lang]
+    return mask
 
 
 def detect_languages(repo_path: Path, max_files: int = 1000) -> LanguageStats:
@@ -167,25 +249,8 @@ def detect_languages(repo_path: Path, max_files: int = 1000) -> LanguageStats:
     Returns:
         LanguageStats with primary language and breakdown
     """
-    counter: Counter[Language] = Counter()
-    files_scanned = 0
-
-    for file_path in repo_path.rglob("*"):
-        if files_scanned >= max_files:
-            break
-
-        # Skip directories in exclusion list
-        if any(skip_dir in file_path.parts for skip_dir in SKIP_DIRS):
-            continue
-
-        if not file_path.is_file():
-            continue
-
-        ext = file_path.suffix.lower()
-        if ext in EXTENSION_MAP:
-            counter[EXTENSION_MAP[ext]] += 1
-            files_scanned += 1
-
+    # Counted in one C-level pass; islice stops the walk after max_files hits
+    counter: Counter[Language] = Counter(islice(_walk_languages(repo_path), max_files))
     total_files = sum(counter.values())
 
     if total_files == 0:
@@ -208,16 +273,18 @@ def detect_languages(repo_path: Path, max_files: int = 1000) -> LanguageStats:
     )
 
 
-def get_language_family(lang: Language) -> set[Language]:
-    """Get related languages (e.g., JS and TS are related)."""
-    families = {
+# Related languages (e.g., JS and TS), keyed by each member
+_LANGUAGE_FAMILIES: dict[Language, frozenset[Language]] = {
+    lang: family
+    for family in (
         frozenset({Language.JAVASCRIPT, Language.TYPESCRIPT}),
         frozenset({Language.C, Language.CPP}),
         frozenset({Language.JAVA, Language.KOTLIN, Language.SCALA}),
-    }
+    )
+    for lang in family
+}
 
-    for family in families:
-        if lang in family:
-            return set(family)
 
-    return {lang}
+def get_language_family(lang: Language) -> set[Language]:
+    """Get related languages (e.g., JS and TS are related)."""
+    return set(_LANGUAGE_FAMILIES.get(lang, (lang,)))
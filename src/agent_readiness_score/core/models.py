@@ -2,6 +2,8 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import compress
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Literal, TYPE_CHECKING
 
@@ -23,7 +25,7 @@ class CheckScope(str, Enum):
     ANY = "any"        # Root or package level
 
 
-@dataclass
+@dataclass(slots=True)
 class Package:
     """A detected package/workspace within a repository."""
     path: Path
@@ -44,8 +46,37 @@ class Package:
             return 1.5
         return 1.0
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "path": str(self.path),
+            "name": self.name,
+            "languages": sorted(lang.value for lang in self.languages),
+            "package_manager": self.package_manager,
+            "has_tests": self.has_tests,
+            "has_lockfile": self.has_lockfile,
+            "has_types": self.has_types,
+            "line_count": self.line_count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Package":
+        """Rebuild a Package from to_dict() output."""
+        from agent_readiness_score.core.language import Language
 
-@dataclass
+        return cls(
+            path=Path(data["path"]),
+            name=data["name"],
+            languages={Language(lang) for lang in data["languages"]},
+            package_manager=data["package_manager"],
+            has_tests=data["has_tests"],
+            has_lockfile=data["has_lockfile"],
+            has_types=data["has_types"],
+            line_count=data["line_count"],
+        )
+
+
+@dataclass(slots=True)
 class RepoStructure:
     """Detected repository structure."""
     type: RepoType
@@ -65,8 +96,29 @@ class RepoStructure:
             langs.update(pkg.languages)
         return langs
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "type": self.type.value,
+            "packages": [pkg.to_dict() for pkg in self.packages],
+            "root_configs": [str(p) for p in self.root_configs],
+            "root_languages": sorted(lang.value for lang in self.root_languages),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RepoStructure":
+        """Rebuild a RepoStructure from to_dict() output."""
+        from agent_readiness_score.core.language import Language
+
+        return cls(
+            type=RepoType(data["type"]),
+            packages=[Package.from_dict(pkg) for pkg in data["packages"]],
+            root_configs=[Path(p) for p in data["root_configs"]],
+            root_languages={Language(lang) for lang in data["root_languages"]},
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class PackageScore:
     """Score for a single package."""
     package: Package
@@ -104,7 +156,7 @@ CATEGORY_WEIGHTS: dict[Category, float] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """A single finding from a scanner."""
 
@@ -115,7 +167,7 @@ class Finding:
     weight: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryScore:
     """Score for a single category."""
 
@@ -127,14 +179,14 @@ class CategoryScore:
 
     @property
     def found_count(self) -> int:
-        return sum(1 for f in self.findings if f.found)
+        return sum(map(_found, self.findings))
 
     @property
     def total_count(self) -> int:
         return len(self.findings)
 
 
-@dataclass
+@dataclass(slots=True)
 class SharedInfraFinding:
     """A finding for shared infrastructure at repo root."""
     name: str
@@ -142,7 +194,7 @@ class SharedInfraFinding:
     path: Path | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanReport:
     """Complete scan report for a repository."""
 
@@ -166,70 +218,104 @@ class ScanReport:
             "detected_languages": self.detected_languages,
             "scan_duration_ms": round(self.scan_duration_ms, 2),
             "timestamp": self.timestamp,
-            "categories": [
-                {
-                    "name": cs.category.value,
-                    "score": round(cs.score, 1),
-                    "weight": cs.weight,
-                    "weighted_score": round(cs.weighted_score, 2),
-                    "found": cs.found_count,
-                    "total": cs.total_count,
-                    "findings": [
-                        {
-                            "name": f.name,
-                            "found": f.found,
-                            "path": str(f.path) if f.path else None,
-                            "details": f.details,
-                        }
-                        for f in cs.findings
-                    ],
-                }
-                for cs in self.category_scores
-            ],
+            "categories": list(map(_category_dict, self.category_scores)),
         }
 
         # Add repo structure info if available
-        if self.repo_structure:
+        repo_structure = self.repo_structure
+        if repo_structure:
             result["repo_structure"] = {
-                "type": self.repo_structure.type.value,
-                "package_count": len(self.repo_structure.packages),
-                "packages": [
-                    {
-                        "name": pkg.name,
-                        "path": str(pkg.path),
-                        "languages": [l.value for l in pkg.languages],
-                        "package_manager": pkg.package_manager,
-                    }
-                    for pkg in self.repo_structure.packages
-                ],
+                "type": repo_structure.type.value,
+                "package_count": len(repo_structure.packages),
+                "packages": list(map(_package_dict, repo_structure.packages)),
             }
 
         # Add package scores if available
         if self.package_scores:
-            result["package_scores"] = [
-                {
-                    "name": ps.package.name,
-                    "path": str(ps.package.path),
-                    "score": round(ps.score, 1),
-                    "languages": [l.value for l in ps.package.languages],
-                }
-                for ps in self.package_scores
-            ]
+            result["package_scores"] = list(map(_package_score_dict, self.package_scores))
 
         # Add shared infrastructure
         if self.shared_infra:
-            result["shared_infrastructure"] = [
-                {
-                    "name": si.name,
-                    "found": si.found,
-                    "path": str(si.path) if si.path else None,
-                }
-                for si in self.shared_infra
-            ]
+            result["shared_infrastructure"] = list(map(_shared_infra_dict, self.shared_infra))
 
         return result
 
 
+# ScanReport.to_dict serializers, one per model: each reads an attribute
+# once and is mapped over its list
+
+
+def _finding_dict(f: Finding) -> dict[str, Any]:
+    path = f.path
+    return {
+        "name": f.name,
+        "found": f.found,
+        "path": str(path) if path else None,
+        "details": f.details,
+    }
+
+
+def _category_dict(cs: CategoryScore) -> dict[str, Any]:
+    findings = cs.findings
+    return {
+        "name": cs.category.value,
+        "score": round(cs.score, 1),
+        "weight": cs.weight,
+        "weighted_score": round(cs.weighted_score, 2),
+        "found": cs.found_count,
+        "total": len(findings),
+        "findings": list(map(_finding_dict, findings)),
+    }
+
+
+# The report's package summary, not Package.to_dict: that is the full record
+# the structure cache round-trips, while reports keep their published shape
+def _package_dict(pkg: Package) -> dict[str, Any]:
+    return {
+        "name": pkg.name,
+        "path": str(pkg.path),
+        "languages": [lang.value for lang in pkg.languages],
+        "package_manager": pkg.package_manager,
+    }
+
+
+def _package_score_dict(ps: PackageScore) -> dict[str, Any]:
+    pkg = ps.package
+    return {
+        "name": pkg.name,
+        "path": str(pkg.path),
+        "score": round(ps.score, 1),
+        "languages": [lang.value for lang in pkg.languages],
+    }
+
+
+def _shared_infra_dict(si: SharedInfraFinding) -> dict[str, Any]:
+    path = si.path
+    return {
+        "name": si.name,
+        "found": si.found,
+        "path": str(path) if path else None,
+    }
+
+
+_found = attrgetter("found")
+_weight = attrgetter("weight")
+
+
+def findings_score(findings: list[Finding]) -> float:
+    """Percentage (0-100) of the findings' total weight that was found.
+
+    The weight and found columns are each pulled out in one pass (in C),
+    rather than re-reading both fields of every finding per sum.
+    """
+    weights: list[float] = list(map(_weight, findings))
+    total_weight = sum(weights)
+    if total_weight > 0:
+        weighted_found = sum(compress(weights, map(_found, findings)))
+        return (weighted_found / total_weight) * 100
+    return 0.0
+
+
 def calculate_grade(score: float) -> str:
     """Convert numeric score to letter grade."""
     if score >= 90:
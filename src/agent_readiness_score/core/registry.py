@@ -10,6 +10,9 @@ class ScannerRegistry:
     """Registry for scanner implementations."""
 
     _scanners: dict[Category, Scanner] = {}
+    # Snapshots of _scanners for get_all()/categories(), rebuilt after changes
+    _scanners_list_cache: list[Scanner] | None = None
+    _categories_cache: list[Category] | None = None
 
     @classmethod
     def register(cls, scanner_class: Type[BaseScanner]) -> Type[BaseScanner]:
@@ -22,6 +25,7 @@ class ScannerRegistry:
         """
         instance = scanner_class()
         cls._scanners[instance.category] = instance
+        cls._invalidate()
         return scanner_class
 
     @classmethod
@@ -31,15 +35,30 @@ class ScannerRegistry:
 
     @classmethod
     def get_all(cls) -> list[Scanner]:
-        """Get all registered scanners."""
-        return list(cls._scanners.values())
+        """Get all registered scanners.
+
+        The list is shared between calls until the registry changes;
+        callers must not modify it.
+        """
+        if cls._scanners_list_cache is None:
+            cls._scanners_list_cache = list(cls._scanners.values())
+        return cls._scanners_list_cache
 
     @classmethod
     def categories(cls) -> list[Category]:
-        """Get all categories with registered scanners."""
-        return list(cls._scanners.keys())
+        """Get all categories with registered scanners (shared, like get_all)."""
+        if cls._categories_cache is None:
+            cls._categories_cache = list(cls._scanners.keys())
+        return cls._categories_cache
 
     @classmethod
     def clear(cls) -> None:
         """Clear all registered scanners (useful for testing)."""
         cls._scanners.clear()
+        cls._invalidate()
+
+    @classmethod
+    def _invalidate(cls) -> None:
+        """Drop the cached get_all()/categories() lists."""
+        cls._scanners_list_cache = None
+        cls._categories_cache = None
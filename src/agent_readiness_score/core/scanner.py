@@ -1,20 +1,19 @@
 """Scanner protocol and base implementation."""
 
+import contextlib
+import contextvars
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence, Set
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import Any, Protocol, runtime_checkable
 
-from agent_readiness_score.core.models import Category, CategoryScore, Finding, CATEGORY_WEIGHTS
+from agent_readiness_score.core.constants import EXCLUDED_DIRS
+from agent_readiness_score.core.inventory import PackageInventory
+from agent_readiness_score.core.models import Category, CategoryScore, Finding, CATEGORY_WEIGHTS, findings_score
 from agent_readiness_score.core.language import Language, LanguageStats
 
-# Directories to skip during scanning (performance optimization)
-EXCLUDED_DIRS = {
-    "node_modules", ".git", ".venv", "venv", "env", "__pycache__",
-    "dist", "build", "target", ".next", ".nuxt", "coverage",
-    ".pytest_cache", ".mypy_cache", ".ruff_cache", "vendor",
-    ".cargo", ".rustup", "Pods", ".gradle", ".idea", ".vscode",
-}
-
 
 @runtime_checkable
 class Scanner(Protocol):
@@ -61,11 +60,14 @@ class BaseScanner(ABC):
         return f"Scans for {self.category.value} indicators"
 
     @abstractmethod
-    def get_checks(self, lang_stats: LanguageStats | None = None) -> list[tuple[str, list[str], float, set[Language] | None]]:
+    def get_checks(self, lang_stats: LanguageStats | None = None) -> list[tuple[str, list[str], float, Set[Language] | None]]:
         """Return list of checks: (name, file_patterns, weight, applicable_languages).
 
         If applicable_languages is None, the check applies to all languages.
         If it's a set, the check only applies (and counts) if the repo uses those languages.
+
+        The built-in scanners return one list built at import, so callers
+        must treat the result as read-only.
         """
         pass
 
@@ -82,22 +84,14 @@ class BaseScanner(ABC):
         Subclasses can call this and extend the findings list with custom checks.
         """
         findings: list[Finding] = []
-        checks = self.get_checks(lang_stats)
-
-        for check_tuple in checks:
-            # Handle both old 4-tuple and new 6-tuple format
-            if len(check_tuple) == 4:
-                check_name, patterns, weight, applicable_langs = check_tuple
-                scope, critical = "any", False
-            else:
-                check_name, patterns, weight, applicable_langs, scope, critical = check_tuple
-
-            # Skip checks that don't apply to this repo's languages
-            if applicable_langs is not None and lang_stats is not None:
-                if not any(lang_stats.has_language(lang) for lang in applicable_langs):
-                    continue  # Skip this check entirely
-
-            found_path = self._find_first_match(repo_path, patterns)
+        # Checks that don't apply to this repo's languages are skipped entirely
+        checks = applicable_checks(self.get_checks(lang_stats), lang_stats)
+        inventory = repo_inventory(repo_path)
+        # Wildcard names searched everywhere are matched in a single pass
+        inventory.label(pattern for check_tuple in checks for pattern in check_tuple[1])
+
+        for check_name, patterns, weight, _, scope, _ in checks:
+            found_path = self._find_first_match(repo_path, patterns, inventory, scope)
             findings.append(
                 Finding(
                     name=check_name,
@@ -115,12 +109,7 @@ class BaseScanner(ABC):
         Subclasses that override scan() should use this method
         to maintain consistent score calculation.
         """
-        total_weight = sum(f.weight for f in findings)
-        if total_weight > 0:
-            weighted_found = sum(f.weight for f in findings if f.found)
-            score = (weighted_found / total_weight) * 100
-        else:
-            score = 0.0
+        score = findings_score(findings)
 
         category_weight = CATEGORY_WEIGHTS[self.category]
 
@@ -132,52 +121,146 @@ class BaseScanner(ABC):
             findings=findings,
         )
 
-    def _find_first_match(self, repo_path: Path, patterns: list[str]) -> Path | None:
+    def _find_first_match(
+        self,
+        repo_path: Path,
+        patterns: list[str],
+        inventory: PackageInventory | None = None,
+        scope: str = "any",
+    ) -> Path | None:
         """Find the first file matching any of the patterns.
 
-        Searches root level first, then subdirectories for polyrepo/monorepo support.
-        Excludes node_modules, .git, and other heavy directories for performance.
+        Searches root level first, then subdirectories for polyrepo/monorepo
+        support (unless scope is "root"). Excludes node_modules, .git, and
+        other heavy directories for performance. Patterns are answered from
+        one inventory of the repo (see repo_inventory) rather than a glob of
+        the tree per pattern.
         """
+        if inventory is None:
+            inventory = repo_inventory(repo_path)
+
         # First pass: check root level and explicit patterns
-        for pattern in patterns:
-            for match in repo_path.glob(pattern):
-                if not self._is_excluded(match):
-                    try:
-                        return match.relative_to(repo_path)
-                    except ValueError:
-                        return match
-
-        # Second pass: recursive search in subdirectories
-        # Skip patterns that already have ** or are directories
-        for pattern in patterns:
-            if "**" in pattern or pattern.endswith("/"):
-                continue
-            # Try recursive pattern with exclusion filtering
-            recursive_pattern = f"**/{pattern}"
-            for match in repo_path.glob(recursive_pattern):
-                if not self._is_excluded(match):
-                    try:
-                        return match.relative_to(repo_path)
-                    except ValueError:
-                        return match
-
-        return None
-
-    def _is_excluded(self, path: Path) -> bool:
-        """Check if path is in an excluded directory."""
-        return any(excluded in path.parts for excluded in EXCLUDED_DIRS)
+        rel = inventory.first_match(patterns, root_only=True)
+        if rel is None and scope != "root":
+            # Second pass: recursive search in subdirectories
+            # Skip patterns that already have ** or are directories
+            rel = inventory.first_match(
+                [p for p in patterns if "**" not in p and not p.endswith("/")]
+            )
+        return Path(rel) if rel is not None else None
+
+
+# The inventory of the repo being scanned, shared by every scanner that
+# runs inside shared_inventory()
+_shared_inventory: contextvars.ContextVar[PackageInventory | None] = contextvars.ContextVar(
+    "_shared_inventory", default=None
+)
+
+
+def repo_inventory(repo_path: Path) -> PackageInventory:
+    """The inventory _find_first_match searches: the whole repo outside
+    EXCLUDED_DIRS, without following directory symlinks (like **).
+
+    Reuses the one set up by shared_inventory() for the same repo_path.
+    """
+    inventory = _shared_inventory.get()
+    if inventory is not None and inventory.root == repo_path:
+        return inventory
+    return PackageInventory(repo_path, EXCLUDED_DIRS, max_depth=None, follow_symlinks=False)
+
+
+@contextlib.contextmanager
+def shared_inventory(repo_path: Path) -> Iterator[PackageInventory]:
+    """Walk repo_path once for all scanners run within the block.
+
+    Without it, each scanner's scan() walks the repo for itself.
+    """
+    inventory = repo_inventory(repo_path)
+    token = _shared_inventory.set(inventory)
+    try:
+        yield inventory
+    finally:
+        _shared_inventory.reset(token)
+
+
+def run_all(
+    scanners: Sequence[Scanner],
+    repo_path: Path,
+    lang_stats: LanguageStats | None = None,
+    max_workers: int | None = None,
+) -> list[CategoryScore]:
+    """Run every scanner on repo_path concurrently; scores come back in
+    scanner order.
+
+    Each scanner runs in a copy of the caller's context, so a
+    shared_inventory() around the call is searched by all of them.
+    max_workers defaults to min(8, cpu count); with 1 the scanners run
+    one after another in the calling thread (for deterministic profiling).
+    """
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1)
+    workers = min(len(scanners), max_workers)
+    if workers <= 1:
+        return [scanner.scan(repo_path, lang_stats) for scanner in scanners]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, scanner.scan, repo_path, lang_stats)
+            for scanner in scanners
+        ]
+        return [future.result() for future in futures]
 
 
 # Type alias for check tuples
 # (name, patterns, weight, applicable_languages, scope, critical)
-Check = tuple[str, list[str], float, set[Language] | None, str, bool]
+Check = tuple[str, list[str], float, Set[Language] | None, str, bool]
+
+# Language tags of the helpers below, shared by every check they build
+_PYTHON = frozenset({Language.PYTHON})
+_JS_TS = frozenset({Language.JAVASCRIPT, Language.TYPESCRIPT})
+_TYPESCRIPT = frozenset({Language.TYPESCRIPT})
+_GO = frozenset({Language.GO})
+_RUST = frozenset({Language.RUST})
+_RUBY = frozenset({Language.RUBY})
+_JVM = frozenset({Language.JAVA, Language.KOTLIN})
+_SWIFT = frozenset({Language.SWIFT})
+_CSHARP = frozenset({Language.CSHARP})
+_C_CPP = frozenset({Language.C, Language.CPP})
+_PHP = frozenset({Language.PHP})
+_ELIXIR = frozenset({Language.ELIXIR})
+_DART = frozenset({Language.DART})
+
+
+def as_check(check_tuple: tuple[Any, ...]) -> Check:
+    """Normalize a check from get_checks() to the 6-tuple Check format.
+
+    Old-style 4-tuples (name, patterns, weight, applicable_languages) get
+    the default scope "any" and are not critical.
+    """
+    if len(check_tuple) == 4:
+        return (*check_tuple, "any", False)
+    return check_tuple
+
+
+def applicable_checks(checks: Iterable[tuple[Any, ...]], lang_stats: LanguageStats | None) -> list[Check]:
+    """checks as Check 6-tuples (see as_check), without those for languages
+    that lang_stats shows the repo doesn't use.
+
+    With no lang_stats, every check applies.
+    """
+    if lang_stats is None:
+        return [as_check(check_tuple) for check_tuple in checks]
+    return [
+        check_tuple
+        for check_tuple in map(as_check, checks)
+        if check_tuple[3] is None or lang_stats.has_any_language(check_tuple[3])
+    ]
 
 
 def check(
     name: str,
     patterns: list[str],
     weight: float = 1.0,
-    langs: set[Language] | None = None,
+    langs: Set[Language] | None = None,
     scope: str = "any",
     critical: bool = False,
 ) -> Check:
@@ -187,67 +270,67 @@ def check(
 
 def py(*patterns: str, name: str, weight: float = 1.0, scope: str = "any", critical: bool = False) -> Check:
     """Python-specific check."""
-    return (name, list(patterns), weight, {Language.PYTHON}, scope, critical)
+    return (name, list(patterns), weight, _PYTHON, scope, critical)
 
 
 def js(*patterns: str, name: str, weight: float = 1.0, scope: str = "any", critical: bool = False) -> Check:
     """JavaScript-specific check."""
-    return (name, list(patterns), weight, {Language.JAVASCRIPT, Language.TYPESCRIPT}, scope, critical)
+    return (name, list(patterns), weight, _JS_TS, scope, critical)
 
 
 def ts(*patterns: str, name: str, weight: float = 1.0, scope: str = "any", critical: bool = False) -> Check:
     """TypeScript-specific check."""
-    return (name, list(patterns), weight, {Language.TYPESCRIPT}, scope, critical)
+    return (name, list(patterns), weight, _TYPESCRIPT, scope, critical)
 
 
 def go(*patterns: str, name: str, weight: float = 1.0, scope: str = "any", critical: bool = False) -> Check:
     """Go-specific check."""
-    return (name, list(patterns), weight, {Language.GO}, scope, critical)
+    return (name, list(patterns), weight, _GO, scope, critical)
 
 
 def rust(*patterns: str, name: str, weight: float = 1.0, scope: str = "any", critical: bool = False) -> Check:
     """Rust-specific check."""
-    return (name, list(patterns), weight, {Language.RUST}, scope, critical)
+    return (name, list(patterns), weight, _RUST, scope, critical)
 
 
 def ruby(*patterns: str, name: str, weight: float = 1.0, scope: str = "any", critical: bool = False) -> Check:
     """Ruby-specific check."""
-    return (name, list(patterns), weight, {Language.RUBY}, scope, critical)
+    return (name, list(patterns), weight, _RUBY, scope, critical)
 
 
 def java(*patterns: str, name: str, weight: float = 1.0, scope: str = "any", critical: bool = False) -> Check:
     """Java-specific check."""
-    return (name, list(patterns), weight, {Language.JAVA, Language.KOTLIN}, scope, critical)
+    return (name, list(patterns), weight, _JVM, scope, critical)
 
 
 def swift(*patterns: str, name: str, weight: float = 1.0, scope: str = "any", critical: bool = False) -> Check:
     """Swift-specific check."""
-    return (name, list(patterns), weight, {Language.SWIFT}, scope, critical)
+    return (name, list(patterns), weight, _SWIFT, scope, critical)
 
 
 def csharp(*patterns: str, name: str, weight: float = 1.0, scope: str = "any", critical: bool = False) -> Check:
     """C#-specific check."""
-    return (name, list(patterns), weight, {Language.CSHARP}, scope, critical)
+    return (name, list(patterns), weight, _CSHARP, scope, critical)
 
 
 def cpp(*patterns: str, name: str, weight: float = 1.0, scope: str = "any", critical: bool = False) -> Check:
     """C/C++-specific check."""
-    return (name, list(patterns), weight, {Language.C, Language.CPP}, scope, critical)
+    return (name, list(patterns), weight, _C_CPP, scope, critical)
 
 
 def php(*patterns: str, name: str, weight: float = 1.0, scope: str = "any", critical: bool = False) -> Check:
     """PHP-specific check."""
-    return (name, list(patterns), weight, {Language.PHP}, scope, critical)
+    return (name, list(patterns), weight, _PHP, scope, critical)
 
 
 def elixir(*patterns: str, name: str, weight: float = 1.0, scope: str = "any", critical: bool = False) -> Check:
     """Elixir-specific check."""
-    return (name, list(patterns), weight, {Language.ELIXIR}, scope, critical)
+    return (name, list(patterns), weight, _ELIXIR, scope, critical)
 
 
 def dart(*patterns: str, name: str, weight: float = 1.0, scope: str = "any", critical: bool = False) -> Check:
     """Dart-specific check."""
-    return (name, list(patterns), weight, {Language.DART}, scope, critical)
+    return (name, list(patterns), weight, _DART, scope, critical)
 
 
 def universal(*patterns: str, name: str, weight: float = 1.0, scope: str = "any", critical: bool = False) -> Check:
@@ -261,6 +344,6 @@ def root(*patterns: str, name: str, weight: float = 1.0, critical: bool = False)
     return (name, list(patterns), weight, None, "root", critical)
 
 
-def pkg(*patterns: str, name: str, weight: float = 1.0, langs: set[Language] | None = None, critical: bool = False) -> Check:
+def pkg(*patterns: str, name: str, weight: float = 1.0, langs: Set[Language] | None = None, critical: bool = False) -> Check:
     """Package-level only check."""
     return (name, list(patterns), weight, langs, "package", critical)
@@ -1,6 +1,33 @@
-"""Output formatters for agent-ready."""
+"""Output formatters for agent-ready.
+
+Formatters are imported on first access, so JSON output doesn't pull in
+rich's table and panel modules.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agent_readiness_score.output.console import ConsoleFormatter
+    from agent_readiness_score.output.json_output import JSONFormatter
+
+_LAZY_EXPORTS = {
+    "ConsoleFormatter": "agent_readiness_score.output.console",
+    "JSONFormatter": "agent_readiness_score.output.json_output",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS})
 
-from agent_readiness_score.output.console import ConsoleFormatter
-from agent_readiness_score.output.json_output import JSONFormatter
 
 __all__ = ["ConsoleFormatter", "JSONFormatter"]
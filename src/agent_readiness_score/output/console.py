@@ -1,5 +1,8 @@
 """Rich console output formatter."""
 
+import functools
+from operator import attrgetter
+
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -10,6 +13,25 @@ from agent_readiness_score.core.models import ScanReport, RepoType
 # Progress bar configuration
 PROGRESS_BAR_WIDTH = 10
 
+# Sort keys for table rows
+_by_score = attrgetter("score")
+_by_category = attrgetter("category.value")
+
+GRADE_COLORS = {
+    "A": "green",
+    "B": "blue",
+    "C": "yellow",
+    "D": "orange1",
+    "F": "red",
+}
+
+
+@functools.cache
+def _progress_bar(filled: int, color: str) -> str:
+    """Progress bar markup; there are only a few dozen (fill level, color) pairs."""
+    empty = PROGRESS_BAR_WIDTH - filled
+    return f"[{color}]{'█' * filled}[/{color}][dim]{'░' * empty}[/dim]"
+
 
 class ConsoleFormatter:
     """Rich console output formatter with tables and colors."""
@@ -65,7 +87,7 @@ class ConsoleFormatter:
         table.add_column("Score", justify="right", width=8)
         table.add_column("Key Findings", width=36)
 
-        for ps in sorted(report.package_scores, key=lambda x: x.score, reverse=True):
+        for ps in sorted(report.package_scores, key=_by_score, reverse=True):
             score_color = self._get_score_color(ps.score)
             langs = ", ".join(sorted(l.value.upper()[:2] for l in ps.package.languages)[:3])
             if len(ps.package.languages) > 3:
@@ -135,7 +157,7 @@ class ConsoleFormatter:
         table.add_column("Progress", width=12)
         table.add_column("Found", justify="center", width=10)
 
-        for cs in sorted(report.category_scores, key=lambda x: x.category.value):
+        for cs in sorted(report.category_scores, key=_by_category):
             score_color = self._get_score_color(cs.score)
             progress_bar = self._create_progress_bar(cs.score)
 
@@ -156,16 +178,16 @@ class ConsoleFormatter:
         self.console.print("\n[bold]Detailed Findings:[/bold]\n")
 
         for cs in report.category_scores:
-            self.console.print(
-                f"[bold cyan]{cs.category.value.replace('_', ' ').title()}[/bold cyan]"
-            )
+            # One print (and markup parse) per category rather than per finding
+            lines = [f"[bold cyan]{cs.category.value.replace('_', ' ').title()}[/bold cyan]"]
 
             for finding in cs.findings:
                 icon = "[green]✓[/green]" if finding.found else "[red]✗[/red]"
                 path_info = f" ([dim]{finding.path}[/dim])" if finding.path else ""
                 details = f" - {finding.details}" if finding.details else ""
-                self.console.print(f"  {icon} {finding.name}{path_info}{details}")
+                lines.append(f"  {icon} {finding.name}{path_info}{details}")
 
+            self.console.print("\n".join(lines))
             self.console.print()
 
     def _print_summary(self, report: ScanReport) -> None:
@@ -205,20 +227,11 @@ class ConsoleFormatter:
 
     def _get_grade_color(self, grade: str) -> str:
         """Get color based on grade."""
-        return {
-            "A": "green",
-            "B": "blue",
-            "C": "yellow",
-            "D": "orange1",
-            "F": "red",
-        }.get(grade, "white")
+        return GRADE_COLORS.get(grade, "white")
 
     def _create_progress_bar(self, score: float) -> str:
         """Create a text-based progress bar."""
-        filled = int(score / PROGRESS_BAR_WIDTH)
-        empty = PROGRESS_BAR_WIDTH - filled
-        color = self._get_score_color(score)
-        return f"[{color}]{'█' * filled}[/{color}][dim]{'░' * empty}[/dim]"
+        return _progress_bar(int(score / PROGRESS_BAR_WIDTH), self._get_score_color(score))
 
     def _get_readiness_level(self, score: float, repo_structure=None) -> str:
         """Get descriptive readiness level."""
@@ -3,19 +3,42 @@
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from agent_readiness_score.core.models import ScanReport
 
 
 class JSONFormatter:
-    """JSON output formatter."""
+    """JSON output formatter.
+
+    Encodes with orjson when it is installed and the indent is 2, else
+    with the json module. orjson writes non-ASCII text as raw UTF-8 rather
+    than \\u escapes; both decode to the same report.
+    """
 
     def __init__(self, indent: int = 2):
         self.indent = indent
 
     def format(self, report: ScanReport) -> str:
         """Format report as JSON string."""
+        encoded = self._encode(report)
+        if encoded is not None:
+            return encoded.decode()
         return json.dumps(report.to_dict(), indent=self.indent)
 
     def save(self, report: ScanReport, path: Path) -> None:
         """Save JSON report to file."""
-        path.write_text(self.format(report))
+        encoded = self._encode(report)
+        if encoded is not None:
+            path.write_bytes(encoded)
+        else:
+            path.write_text(self.format(report))
+
+    def _encode(self, report: ScanReport) -> bytes | None:
+        """The report as UTF-8 JSON from orjson, or None if it can't be used."""
+        if orjson is None or self.indent != 2:
+            return None
+        return orjson.dumps(report.to_dict(), option=orjson.OPT_INDENT_2)
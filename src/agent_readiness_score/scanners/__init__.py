@@ -12,6 +12,7 @@ from agent_readiness_score.scanners.testing import TestingScanner
 from agent_readiness_score.scanners.dependencies import DependenciesScanner
 from agent_readiness_score.scanners.documentation import DocumentationScanner
 from agent_readiness_score.scanners.typing import TypingScanner
+from agent_readiness_score.core.scanner import run_all
 
 __all__ = [
     "StyleScanner",
@@ -22,4 +23,5 @@ __all__ = [
     "DependenciesScanner",
     "DocumentationScanner",
     "TypingScanner",
+    "run_all",
 ]
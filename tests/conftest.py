@@ -7,6 +7,12 @@ from typing import Generator
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path: Path, monkeypatch) -> None:
+    """Keep the structure cache out of the user's real cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
 @pytest.fixture
 def temp_repo(tmp_path: Path) -> Path:
     """Create a temporary directory for test repositories."""
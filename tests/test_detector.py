@@ -0,0 +1,180 @@
+"""Tests for repository structure detection."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from agent_readiness_score.core.cache import load_structure
+from agent_readiness_score.core.detector import detect_repo_structure
+from agent_readiness_score.core.models import RepoType
+
+
+class TestCargoWorkspace:
+    """Test Cargo workspace detection."""
+
+    def _make_crate(self, repo: Path, name: str) -> None:
+        crate = repo / name
+        (crate / "src").mkdir(parents=True)
+        (crate / "Cargo.toml").write_text(f'[package]\nname = "{name}"\n')
+        (crate / "src" / "lib.rs").write_text("pub fn f() {}\n")
+
+    def test_inline_members(self, temp_repo: Path):
+        """Test that single-line members arrays are parsed."""
+        (temp_repo / "Cargo.toml").write_text('[workspace]\nmembers = ["a", "b"]\n')
+        self._make_crate(temp_repo, "a")
+        self._make_crate(temp_repo, "b")
+
+        structure = detect_repo_structure(temp_repo)
+
+        assert structure.type == RepoType.MONOREPO
+        assert sorted(p.name for p in structure.packages) == ["a", "b"]
+
+    def test_multiline_glob_members(self, temp_repo: Path):
+        """Test that multi-line members arrays with globs are parsed."""
+        (temp_repo / "Cargo.toml").write_text('[workspace]\nmembers = [\n    "crates/*",\n]\n')
+        self._make_crate(temp_repo / "crates", "core")
+        self._make_crate(temp_repo / "crates", "cli")
+
+        structure = detect_repo_structure(temp_repo)
+
+        assert structure.type == RepoType.MONOREPO
+        assert sorted(p.name for p in structure.packages) == ["cli", "core"]
+
+
+class TestNpmWorkspace:
+    """Test npm/yarn workspace detection."""
+
+    def test_overlapping_patterns(self, temp_repo: Path):
+        """Test that a package matched by two patterns is reported once."""
+        (temp_repo / "package.json").write_text(
+            '{"workspaces": ["packages/*", "packages/core"]}'
+        )
+        for name in ("core", "ui"):
+            pkg = temp_repo / "packages" / name
+            pkg.mkdir(parents=True)
+            (pkg / "package.json").write_text("{}")
+
+        structure = detect_repo_structure(temp_repo)
+
+        assert structure.type == RepoType.MONOREPO
+        assert sorted(p.name for p in structure.packages) == ["core", "ui"]
+
+    def test_symlinked_members(self, temp_repo: Path):
+        """Test that workspace members linked into a glob's directory are found."""
+        (temp_repo / "package.json").write_text('{"workspaces": ["packages/*"]}')
+        (temp_repo / "packages" / "core").mkdir(parents=True)
+        (temp_repo / "packages" / "core" / "package.json").write_text("{}")
+        (temp_repo / "shared").mkdir()
+        (temp_repo / "shared" / "package.json").write_text("{}")
+        try:
+            (temp_repo / "packages" / "shared").symlink_to(temp_repo / "shared")
+        except OSError:
+            pytest.skip("Cannot create symlinks on this system")
+
+        structure = detect_repo_structure(temp_repo)
+
+        assert sorted(p.name for p in structure.packages) == ["core", "shared"]
+
+
+class TestPackageDetection:
+    """Test package discovery in non-workspace repos."""
+
+    def test_nested_package_belongs_to_parent(self, temp_repo: Path):
+        """Test that a manifest inside a package doesn't start a new package."""
+        (temp_repo / "api").mkdir()
+        (temp_repo / "api" / "go.mod").write_text("module api\n")
+        (temp_repo / "api" / "main.go").write_text("package main\n")
+        (temp_repo / "api" / "web").mkdir()
+        (temp_repo / "api" / "web" / "package.json").write_text("{}")
+        (temp_repo / "cli").mkdir()
+        (temp_repo / "cli" / "pyproject.toml").write_text("[project]\nname = 'cli'\n")
+
+        structure = detect_repo_structure(temp_repo)
+
+        assert structure.type == RepoType.POLYREPO
+        assert [str(p.path) for p in structure.packages] == ["api", "cli"]
+
+
+class TestSharedRootConfigs:
+    """Test that packages inherit lockfiles and type configs from the root."""
+
+    def test_root_lockfile_and_types_apply_to_packages(self, temp_repo: Path):
+        """Test that a root lockfile/tsconfig counts for every package."""
+        (temp_repo / "package.json").write_text('{"workspaces": ["packages/*"]}')
+        (temp_repo / "package-lock.json").write_text("{}")
+        (temp_repo / "tsconfig.json").write_text("{}")
+        for name in ("a", "b"):
+            pkg = temp_repo / "packages" / name
+            pkg.mkdir(parents=True)
+            (pkg / "package.json").write_text("{}")
+
+        structure = detect_repo_structure(temp_repo)
+
+        assert len(structure.packages) == 2
+        assert all(p.has_lockfile and p.has_types for p in structure.packages)
+
+
+class TestTestDetection:
+    """Test detection of package tests."""
+
+    def test_test_file_in_src(self, temp_repo: Path):
+        """Test that colocated test files count as tests."""
+        (temp_repo / "package.json").write_text("{}")
+        (temp_repo / "src").mkdir()
+        (temp_repo / "src" / "app.test.ts").write_text("test('x', () => {})\n")
+
+        structure = detect_repo_structure(temp_repo)
+
+        assert structure.packages[0].has_tests
+
+    def test_test_substring_is_not_a_test(self, temp_repo: Path):
+        """Test that names merely containing "test" aren't treated as tests."""
+        (temp_repo / "pyproject.toml").write_text("[project]\nname = 'x'\n")
+        (temp_repo / "latest.py").write_text("VERSION = 1\n")
+
+        structure = detect_repo_structure(temp_repo)
+
+        assert not structure.packages[0].has_tests
+
+
+class TestStructureCache:
+    """Test the on-disk structure cache."""
+
+    def _backdate(self, repo: Path) -> None:
+        """Age every path past the cache's racy-mtime window."""
+        past = time.time() - 60
+        for dirpath, dirnames, filenames in os.walk(repo):
+            for name in dirnames + filenames:
+                os.utime(os.path.join(dirpath, name), (past, past))
+        os.utime(repo, (past, past))
+
+    def test_reuses_unchanged_structure(self, python_repo: Path):
+        """Test that an unchanged repo is served from the cache."""
+        self._backdate(python_repo)
+
+        structure = detect_repo_structure(python_repo, use_cache=True)
+
+        assert load_structure(python_repo) == structure
+        assert detect_repo_structure(python_repo, use_cache=True) == structure
+
+    def test_invalidated_by_new_package(self, python_repo: Path):
+        """Test that adding a package invalidates the cached structure."""
+        self._backdate(python_repo)
+        detect_repo_structure(python_repo, use_cache=True)
+
+        (python_repo / "tools").mkdir()
+        (python_repo / "tools" / "go.mod").write_text("module tools\n")
+
+        assert load_structure(python_repo) is None
+        structure = detect_repo_structure(python_repo, use_cache=True)
+        assert any(pkg.name == "tools" for pkg in structure.packages)
+
+    def test_disabled_by_default(self, python_repo: Path):
+        """Test that nothing is cached unless requested."""
+        self._backdate(python_repo)
+
+        detect_repo_structure(python_repo)
+
+        assert load_structure(python_repo) is None
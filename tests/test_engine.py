@@ -6,6 +6,9 @@ import pytest
 
 from agent_readiness_score.core.engine import ScanEngine
 from agent_readiness_score.core.models import Category, ScanReport
+from agent_readiness_score.core.registry import ScannerRegistry
+from agent_readiness_score.scanners.style import StyleScanner
+from agent_readiness_score.scanners.testing import TestingScanner
 
 
 class TestScanEngine:
@@ -248,6 +251,42 @@ class TestScanEngine:
                 assert cat_score.score <= 100
 
 
+    def test_scan_multi_package_repo(self, tmp_path: Path):
+        """Test that every package is scored, in detection order, with its own checks."""
+        repo = tmp_path / "repo"
+        for name in ("api", "cli", "worker"):
+            (repo / name).mkdir(parents=True)
+            (repo / name / "pyproject.toml").write_text(f"[project]\nname = '{name}'\n")
+            (repo / name / "main.py").write_text("def main() -> None: pass\n")
+        (repo / "api" / "tests").mkdir()
+        (repo / "api" / "tests" / "test_main.py").write_text("def test_main(): pass\n")
+        (repo / "web").mkdir()
+        (repo / "web" / "package.json").write_text('{"name": "web"}\n')
+        (repo / "web" / "index.js").write_text("export const x = 1;\n")
+
+        # The registry is cleared per test, so register a scanner explicitly
+        ScannerRegistry.register(TestingScanner)
+        engine = ScanEngine()
+        report = engine.scan(repo)
+
+        assert [ps.package.name for ps in report.package_scores] == ["api", "cli", "web", "worker"]
+        assert all(0 <= ps.score <= 100 for ps in report.package_scores)
+
+        findings = {
+            ps.package.name: {f.name: f.found for f in ps.findings}
+            for ps in report.package_scores
+        }
+        assert all(findings.values())
+        # Checks follow each package's own languages
+        for name in ("api", "cli", "worker"):
+            assert "pytest" in findings[name]
+            assert "Jest" not in findings[name]
+        assert "Jest" in findings["web"]
+        assert "pytest" not in findings["web"]
+        assert findings["api"]["Test directory"]
+        assert not findings["cli"]["Test directory"]
+
+
 class TestScanEngineEdgeCases:
     """Test edge cases and error handling."""
 
@@ -320,3 +359,19 @@ class TestScanEngineEdgeCases:
 
         # Should handle unicode filenames gracefully
         assert report.total_score >= 0
+
+
+class TestScannerRegistry:
+    """Test the registry's cached scanner lists."""
+
+    def test_lists_are_refreshed_after_changes(self):
+        """Test that get_all()/categories() reflect register() and clear()."""
+        ScannerRegistry.clear()
+        assert ScannerRegistry.get_all() == []
+        assert ScannerRegistry.categories() == []
+
+        ScannerRegistry.register(StyleScanner)
+
+        assert ScannerRegistry.get_all() is ScannerRegistry.get_all()
+        assert [s.category for s in ScannerRegistry.get_all()] == [Category.STYLE]
+        assert ScannerRegistry.categories() == [Category.STYLE]
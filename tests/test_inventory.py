@@ -0,0 +1,105 @@
+"""Tests for the package file inventory."""
+
+from pathlib import Path
+
+from agent_readiness_score.core.inventory import PackageInventory
+
+
+class TestPackageInventory:
+    """Test pattern lookups against an inventoried tree."""
+
+    def _make_tree(self, root: Path) -> None:
+        (root / "src" / "core").mkdir(parents=True)
+        (root / "src" / "core" / "mypy.ini").write_text("")
+        (root / "docs").mkdir()
+        (root / "docs" / "mypy.ini").write_text("")
+        (root / "tsconfig.json").write_text("{}")
+        (root / "tsconfig.build.json").write_text("{}")
+        (root / "node_modules" / "pkg").mkdir(parents=True)
+        (root / "node_modules" / "pkg" / "setup.cfg").write_text("")
+
+    def test_literal_matches_in_depth_first_order(self, tmp_path: Path):
+        """Test that name lookups return matches in walk order."""
+        self._make_tree(tmp_path)
+        inventory = PackageInventory(tmp_path, {"node_modules"})
+
+        matches = list(inventory.matches("mypy.ini"))
+
+        assert sorted(matches) == ["docs/mypy.ini", "src/core/mypy.ini"]
+        assert list(inventory.matches("mypy.ini", root_only=True)) == []
+
+    def test_wildcard_and_nested_patterns(self, tmp_path: Path):
+        """Test that wildcards match like Path.glob."""
+        self._make_tree(tmp_path)
+        inventory = PackageInventory(tmp_path, {"node_modules"})
+
+        assert list(inventory.matches("tsconfig.*.json", root_only=True)) == ["tsconfig.build.json"]
+        assert list(inventory.matches("src/*/mypy.ini")) == ["src/core/mypy.ini"]
+        assert list(inventory.matches("docs/", root_only=True)) == ["docs"]
+        assert list(inventory.matches("tsconfig.json/", root_only=True)) == []
+
+    def test_nested_patterns_found_below_each_matching_directory(self, tmp_path: Path):
+        """Test that a literal first segment is matched at every depth, in walk order."""
+        self._make_tree(tmp_path)
+        (tmp_path / "docs" / "src" / "api").mkdir(parents=True)
+        (tmp_path / "docs" / "src" / "api" / "mypy.ini").write_text("")
+        inventory = PackageInventory(tmp_path, {"node_modules"})
+
+        matches = list(inventory.matches("src/*/mypy.ini"))
+
+        assert sorted(matches) == ["docs/src/api/mypy.ini", "src/core/mypy.ini"]
+        # Each "src" directory's matches come where the walk reaches it
+        assert matches == sorted(matches, key=lambda m: inventory.dirs.index(m.rsplit("/", 2)[0]))
+
+    def test_skip_dirs_and_depth_limit(self, tmp_path: Path):
+        """Test that skipped dirs and dirs past max_depth aren't searched."""
+        self._make_tree(tmp_path)
+        inventory = PackageInventory(tmp_path, {"node_modules"}, max_depth=1)
+
+        assert list(inventory.matches("setup.cfg")) == []
+        assert list(inventory.matches("mypy.ini")) == ["docs/mypy.ini"]
+
+    def test_recursive_patterns_without_following_symlinks(self, tmp_path: Path):
+        """Test that ** walks the whole inventory but not symlinked dirs."""
+        self._make_tree(tmp_path)
+        (tmp_path / "link").symlink_to(tmp_path / "src")
+        inventory = PackageInventory(
+            tmp_path, {"node_modules"}, max_depth=None, follow_symlinks=False
+        )
+
+        assert list(inventory.matches("**/mypy.ini", root_only=True)) == list(
+            inventory.matches("mypy.ini")
+        )
+        assert sorted(inventory.matches("**/mypy.ini", root_only=True)) == [
+            "docs/mypy.ini", "src/core/mypy.ini",
+        ]
+        assert list(inventory.matches("src/**/*.ini", root_only=True)) == ["src/core/mypy.ini"]
+        assert "link" not in inventory.dirs
+
+    def test_labeled_patterns_match_like_unlabeled(self, tmp_path: Path):
+        """Test that label() precomputes the same matches, in the same order."""
+        self._make_tree(tmp_path)
+        queries = [("*.ini", False), ("**/*.ini", True), ("tsconfig*", False)]
+        expected = [
+            list(PackageInventory(tmp_path, {"node_modules"}).matches(p, root_only=r))
+            for p, r in queries
+        ]
+        inventory = PackageInventory(tmp_path, {"node_modules"})
+
+        inventory.label(["*.ini", "**/*.ini", "tsconfig*", "README.md", "src/*/mypy.ini"])
+
+        assert [list(inventory.matches(p, root_only=r)) for p, r in queries] == expected
+        assert expected[0] == expected[1]
+
+    def test_first_match_skips_excluded_names(self, tmp_path: Path):
+        """Test that first_match tries patterns in order and skips skip_dirs."""
+        self._make_tree(tmp_path)
+        (tmp_path / "node_modules" / "setup.cfg").write_text("")
+        inventory = PackageInventory(tmp_path, {"node_modules"})
+
+        assert inventory.first_match(["setup.cfg", "tsconfig.json"]) == "tsconfig.json"
+        assert inventory.first_match(["mypy.ini"], root_only=True) is None
+        assert inventory.first_match(["README.md"]) is None
+        # Remembered: later changes on disk aren't seen
+        (tmp_path / "README.md").write_text("")
+        assert inventory.first_match(["README.md"]) is None
@@ -14,6 +14,8 @@ from agent_readiness_score.scanners.observability import ObservabilityScanner
 from agent_readiness_score.scanners.dependencies import DependenciesScanner
 from agent_readiness_score.scanners.documentation import DocumentationScanner
 from agent_readiness_score.scanners.typing import TypingScanner
+from agent_readiness_score.scanners import run_all
+from agent_readiness_score.core.scanner import BaseScanner, root, universal
 
 
 class TestTestingScanner:
@@ -444,3 +446,44 @@ class TestLanguageSpecificScanning:
 
         # At least one should be true (depending on what was created)
         assert has_python or has_ts or len(finding_names) > 0
+
+
+class TestRunAll:
+    """Test running several scanners at once."""
+
+    def test_concurrent_matches_sequential(self, python_repo: Path):
+        """Test that the thread pool returns the sequential scores, in order."""
+        scanners = [StyleScanner(), TestingScanner(), TypingScanner(), DocumentationScanner()]
+        lang_stats = detect_languages(python_repo)
+
+        sequential = run_all(scanners, python_repo, lang_stats, max_workers=1)
+        concurrent = run_all(scanners, python_repo, lang_stats, max_workers=4)
+
+        assert [cs.category for cs in concurrent] == [s.category for s in scanners]
+        assert concurrent == sequential
+
+
+class TestCheckScope:
+    """Test how a check's scope limits where BaseScanner searches."""
+
+    class _LicenseScanner(BaseScanner):
+        category = Category.DOCUMENTATION
+        name = "License"
+
+        def get_checks(self, lang_stats=None):
+            return [
+                root("LICENSE", name="Root license"),
+                universal("LICENSE", name="Any license"),
+            ]
+
+    def test_root_scope_skips_subdirectories(self, tmp_path: Path):
+        """Test that root-scoped checks aren't found in subdirectories."""
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "LICENSE").write_text("MIT\n")
+
+        result = self._LicenseScanner().scan(tmp_path)
+
+        assert [(f.name, f.path) for f in result.findings] == [
+            ("Root license", None),
+            ("Any license", Path("docs/LICENSE")),
+        ]